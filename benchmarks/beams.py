@@ -0,0 +1,90 @@
+"""Draw time of many line segments: one arcade.draw_line call each vs BeamBatch.
+
+Draws ``--segments`` random segments (about one tracer per turret) for a
+run of frames with each method and reports the mean frame time, including
+the wait for the GPU to finish::
+
+    ARCADE_HEADLESS=1 python -m benchmarks.beams --segments 100 500 2000
+"""
+
+import argparse
+import random
+import time
+
+import arcade
+
+from src.rendering import BeamBatch
+
+SIZE = 1280, 720
+COLOR = (255, 255, 0, 120)
+
+
+def random_segments(count: int) -> list[tuple[float, float, float, float]]:
+    width, height = SIZE
+    return [
+        (
+            random.uniform(0, width),
+            random.uniform(0, height),
+            random.uniform(0, width),
+            random.uniform(0, height),
+        )
+        for _ in range(count)
+    ]
+
+
+def bench_draw_line(
+    window: arcade.Window,
+    segments: list[tuple[float, float, float, float]],
+    frames: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        window.clear()
+        for x1, y1, x2, y2 in segments:
+            arcade.draw_line(x1, y1, x2, y2, COLOR, 1.0)
+        window.ctx.finish()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def bench_beam_batch(
+    window: arcade.Window,
+    segments: list[tuple[float, float, float, float]],
+    frames: int,
+) -> float:
+    beams = BeamBatch()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        window.clear()
+        beams.clear()
+        for x1, y1, x2, y2 in segments:
+            beams.add(x1, y1, x2, y2, COLOR, 1.0)
+        beams.draw()
+        window.ctx.finish()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    window = arcade.Window(*SIZE, visible=False)
+    print(f"{args.frames} frames")
+    print(f"{'segments':>8} {'draw_line ms':>13} {'BeamBatch ms':>13}")
+
+    for count in args.segments:
+        segments = random_segments(count)
+        bench_draw_line(window, segments, 2)  # compile shaders, allocate buffers
+        bench_beam_batch(window, segments, 2)
+
+        per_line = bench_draw_line(window, segments, args.frames)
+        batched = bench_beam_batch(window, segments, args.frames)
+        print(f"{count:>8} {per_line:>13.3f} {batched:>13.3f}")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
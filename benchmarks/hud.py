@@ -0,0 +1,105 @@
+"""Draw time of the HUD drawn by ``UIProcessor.on_draw_ui``.
+
+Sets up a player inventory, the toolbar and a hovered smelter with a
+tooltip, then times ``on_draw_ui`` over a run of frames. Every
+``--change-every`` frames one inventory amount changes, as it does while
+mining.
+
+Needs an OpenGL context; set ``ARCADE_HEADLESS=1`` on machines without a
+display::
+
+    ARCADE_HEADLESS=1 python -m benchmarks.hud --frames 2000
+"""
+
+import argparse
+import statistics
+import time
+
+import arcade
+import esper
+
+from src.components.gameplay import Inventory, PlayerControl
+from src.components.map import MapTag
+from src.components.production import Factory
+from src.components.world import WorldMap
+from src.game_data import BlockType
+from src.processors import CameraProcessor, KeyboardProcessor, MouseProcessor
+from src.processors.builder import ACTUAL_TILE_SIZE, CHUNK_TILES, BuilderProcessor
+from src.processors.ui import UIProcessor
+from src.rendering import ChunkedSpriteLayer
+from src.systems.spatial_index import SpatialIndexService
+
+WINDOW_SIZE = (1280, 720)
+
+
+def make_ui(window: arcade.Window) -> tuple[UIProcessor, Inventory]:
+    esper.clear_database()
+    world_map = WorldMap()
+    esper.create_entity(world_map)
+
+    player_inv = Inventory({"iron": 120, "gold": 45, "silicon": 30})
+    esper.create_entity(player_inv, PlayerControl())
+
+    smelter = esper.create_entity(
+        MapTag(BlockType.SMELTER), Inventory({"iron": 3}), Factory()
+    )
+    world_map.entity_map[(0, 0, 1)] = smelter
+
+    chunk_size = CHUNK_TILES * ACTUAL_TILE_SIZE
+    mouse = MouseProcessor()
+    builder = BuilderProcessor(
+        ChunkedSpriteLayer(chunk_size),
+        ChunkedSpriteLayer(chunk_size),
+        arcade.Camera2D(),
+        mouse,
+        KeyboardProcessor(),
+    )
+
+    # Hover the middle of the smelter's tile
+    center = ACTUAL_TILE_SIZE / 2
+    mouse.x, mouse.y = builder.camera.project((center, center))
+    CameraProcessor(
+        builder.camera, KeyboardProcessor(), mouse, ACTUAL_TILE_SIZE
+    ).update_input_frame()
+
+    ui = UIProcessor(window, mouse, KeyboardProcessor(), builder, SpatialIndexService())
+    return ui, player_inv
+
+
+def bench(window: arcade.Window, frames: int, change_every: int) -> list[float]:
+    ui, player_inv = make_ui(window)
+    times = []
+
+    for frame in range(frames):
+        if change_every and frame % change_every == 0:
+            player_inv.resources["iron"] += 1
+
+        window.clear()
+        start = time.perf_counter()
+        ui.on_draw_ui()
+        window.ctx.finish()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--change-every", type=int, default=12)
+    args = parser.parse_args()
+
+    window = arcade.Window(*WINDOW_SIZE, visible=False)
+    bench(window, 50, args.change_every)  # warm up glyph caches and shaders
+    times = bench(window, args.frames, args.change_every)
+    window.close()
+
+    times.sort()
+    print(f"{args.frames} frames, inventory change every {args.change_every}")
+    print(f"mean   {statistics.fmean(times):8.3f} ms")
+    print(f"median {statistics.median(times):8.3f} ms")
+    print(f"p95    {times[int(len(times) * 0.95)]:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
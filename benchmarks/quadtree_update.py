@@ -0,0 +1,90 @@
+"""Per-frame cost of keeping the asteroid QuadTree in sync.
+
+Compares the old strategy (clear the tree and re-insert every asteroid)
+against incremental ``QuadTree.update`` calls for a field of drifting
+asteroids, the way ``CombatProcessor`` sees them.
+"""
+
+import random
+import time
+
+from src.game_data import MAP_LIMIT_X, MAP_LIMIT_Y
+from src.spatial.quadtree import Point, QuadTree, Rectangle
+
+FRAMES = 60
+DT = 1 / 60
+ASTEROID_COUNTS = [100, 1000, 5000, 10000]
+
+
+def make_field(count: int) -> list[list[float]]:
+    field = []
+    for _ in range(count):
+        field.append(
+            [
+                random.uniform(-MAP_LIMIT_X, MAP_LIMIT_X),
+                random.uniform(-MAP_LIMIT_Y, MAP_LIMIT_Y),
+                random.uniform(-40, 40),
+                random.uniform(-40, 40),
+            ]
+        )
+    return field
+
+
+def step(field: list[list[float]]) -> None:
+    for body in field:
+        body[0] += body[2] * DT
+        body[1] += body[3] * DT
+
+
+def make_tree() -> QuadTree:
+    return QuadTree(Rectangle(0, 0, MAP_LIMIT_X * 1.5, MAP_LIMIT_Y * 1.5), capacity=8)
+
+
+def bench_rebuild(field: list[list[float]]) -> float:
+    tree = make_tree()
+    elapsed = 0.0
+
+    for _ in range(FRAMES):
+        step(field)
+        start = time.perf_counter()
+        tree.clear()
+        for i, (x, y, _, _) in enumerate(field):
+            tree.insert(Point(x, y, i))
+        elapsed += time.perf_counter() - start
+
+    return elapsed / FRAMES
+
+
+def bench_incremental(field: list[list[float]]) -> float:
+    tree = make_tree()
+    for i, (x, y, _, _) in enumerate(field):
+        tree.insert(Point(x, y, i))
+
+    elapsed = 0.0
+
+    for _ in range(FRAMES):
+        step(field)
+        start = time.perf_counter()
+        for i, (x, y, _, _) in enumerate(field):
+            tree.update(i, x, y)
+        elapsed += time.perf_counter() - start
+
+    return elapsed / FRAMES
+
+
+def main() -> None:
+    random.seed(0)
+    print(f"{'asteroids':>10} {'rebuild ms':>12} {'update ms':>12} {'speedup':>8}")
+
+    for count in ASTEROID_COUNTS:
+        field = make_field(count)
+        rebuild = bench_rebuild([body[:] for body in field])
+        incremental = bench_incremental([body[:] for body in field])
+        print(
+            f"{count:>10} {rebuild * 1000:>12.3f} {incremental * 1000:>12.3f}"
+            f" {rebuild / incremental:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Time of ``LogisticsProcessor._find_source`` with many factories.
+
+Builds a field of smelters and assemblers that hold only their own inputs,
+so no factory has outputs to collect and every call has to work out what
+the factories need before finding the storage that holds it, as the first
+idle drone of a tick does (the misses are then remembered for the others)::
+
+    python -m benchmarks.recipes --factories 100 500 2000
+"""
+
+import argparse
+import random
+import time
+
+import esper
+
+from src.components.gameplay import Inventory
+from src.components.logistics import Storage
+from src.components.map import GridPosition, MapTag
+from src.components.physics import Position
+from src.components.production import Factory
+from src.game_data import MAP_LIMIT_X, MAP_LIMIT_Y, BlockType
+from src.processors.logistics import LogisticsProcessor
+from src.spatial.quadtree import Point, QuadTree
+from src.systems.spatial_index import SpatialIndexService
+
+CALLS = 1_000
+STORAGES = 20
+
+
+def make_world(factories: int, rng: random.Random) -> LogisticsProcessor:
+    esper.clear_database()
+    spatial = SpatialIndexService()
+
+    def add_structure(layer: QuadTree, *components) -> None:
+        x = rng.uniform(-MAP_LIMIT_X, MAP_LIMIT_X)
+        y = rng.uniform(-MAP_LIMIT_Y, MAP_LIMIT_Y)
+        ent = esper.create_entity(GridPosition(0, 0), Position(x, y), *components)
+        layer.insert(Point(x, y, ent))
+
+    for i in range(factories):
+        if i % 2:
+            add_structure(
+                spatial.factories,
+                MapTag(BlockType.SMELTER),
+                Factory(),
+                Inventory({"iron": 2}),
+            )
+        else:
+            add_structure(
+                spatial.factories,
+                MapTag(BlockType.ASSEMBLER),
+                Factory(),
+                Inventory({"iron_bar": 1}),
+            )
+
+    for _ in range(STORAGES):
+        add_structure(
+            spatial.storages, Storage(capacity=1000), Inventory({"silicon": 50})
+        )
+
+    return LogisticsProcessor(spatial)
+
+
+def bench(factories: int, calls: int, rng: random.Random) -> float:
+    logistics = make_world(factories, rng)
+    positions = [
+        Position(
+            rng.uniform(-MAP_LIMIT_X, MAP_LIMIT_X),
+            rng.uniform(-MAP_LIMIT_Y, MAP_LIMIT_Y),
+        )
+        for _ in range(calls)
+    ]
+
+    start = time.perf_counter()
+    for pos in positions:
+        # Each call as the first of a new tick
+        logistics._exhausted.clear()
+        logistics._find_source(pos)
+    return (time.perf_counter() - start) * 1e6 / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--factories", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--calls", type=int, default=CALLS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'factories':>9} {'us/call':>10}")
+    for factories in args.factories:
+        print(f"{factories:>9} {bench(factories, args.calls, rng):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
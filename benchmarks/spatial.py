@@ -0,0 +1,299 @@
+"""Benchmark suite for the spatial indexes in ``src.spatial``.
+
+Generates uniform, clustered and streaming (moving) asteroid fields and
+measures build, insert, remove, update, rectangle query, radius query and
+retained memory for every index variant. Results are printed as a table
+and can be written as JSON to track regressions between commits::
+
+    python -m benchmarks.spatial --sizes 1000 10000 --json bench.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+from src.game_data import MAP_LIMIT_X, MAP_LIMIT_Y
+from src.spatial import ArraySpatialIndex, Point, QuadTree, Rectangle, SpatialHashGrid
+
+HALF_W = MAP_LIMIT_X * 1.5
+HALF_H = MAP_LIMIT_Y * 1.5
+BOUNDARY = Rectangle(0, 0, HALF_W, HALF_H)
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DISTRIBUTIONS = ["uniform", "clustered", "streaming"]
+
+OPS_SAMPLE = 1_000  # inserts/removes per measurement
+QUERY_COUNT = 500
+QUERY_HALF_EXTENT = 150.0
+QUERY_RADIUS = 300.0  # Turret.range
+FRAME_DT = 1 / 60
+
+# (x, y, dx, dy) per body
+Field = list[tuple[float, float, float, float]]
+
+
+def make_field(distribution: str, size: int, rng: random.Random) -> Field:
+    if distribution == "clustered":
+        # Mining fields: dense blobs, plus piles of coincident chunks
+        # spawned at the same target position.
+        centers = [
+            (rng.uniform(-HALF_W, HALF_W) * 0.8, rng.uniform(-HALF_H, HALF_H) * 0.8)
+            for _ in range(max(1, size // 500))
+        ]
+        field = []
+        for i in range(size):
+            cx, cy = centers[i % len(centers)]
+            if i % 10 == 0:
+                field.append((cx, cy, 0.0, 0.0))
+            else:
+                field.append((rng.gauss(cx, 60), rng.gauss(cy, 60), 0.0, 0.0))
+        return [
+            (_clamp(x, HALF_W), _clamp(y, HALF_H), dx, dy) for x, y, dx, dy in field
+        ]
+
+    speed = 40.0 if distribution == "streaming" else 0.0
+    return [
+        (
+            rng.uniform(-HALF_W, HALF_W),
+            rng.uniform(-HALF_H, HALF_H),
+            rng.uniform(-speed, speed),
+            rng.uniform(-speed, speed),
+        )
+        for _ in range(size)
+    ]
+
+
+def _clamp(value: float, limit: float) -> float:
+    return max(-limit, min(limit, value))
+
+
+class DynamicVariant:
+    """QuadTree or SpatialHashGrid: supports every operation."""
+
+    supports_insert = True
+
+    def __init__(self, name: str, factory: Callable[[], Any], rect_queries: bool):
+        self.name = name
+        self.factory = factory
+        self.index = factory()
+        self.supports_rect_query = rect_queries
+
+    def build(self, field: Field) -> None:
+        self.index = self.factory()
+        for i, (x, y, _, _) in enumerate(field):
+            self.index.insert(Point(x, y, i))
+
+    def insert(self, entity_id: int, x: float, y: float) -> None:
+        self.index.insert(Point(x, y, entity_id))
+
+    def remove(self, entity_id: int) -> None:
+        self.index.remove(entity_id)
+
+    def update_all(self, field: Field) -> None:
+        for i, (x, y, _, _) in enumerate(field):
+            self.index.update(i, x, y)
+
+    def query(self, rects: list[Rectangle]) -> int:
+        return sum(len(self.index.query(rect)) for rect in rects)
+
+    def query_radius(self, xs: list[float], ys: list[float], radius: float) -> int:
+        return sum(len(self.index.query_radius(x, y, radius)) for x, y in zip(xs, ys))
+
+
+class ArrayVariant:
+    """Static index: insert/remove are not supported, update is a rebuild."""
+
+    def __init__(self, name: str, cell_size: float):
+        self.name = name
+        self.index = ArraySpatialIndex(cell_size)
+
+    def build(self, field: Field) -> None:
+        data = np.asarray(field, dtype=np.float64).reshape(-1, 4)
+        self.index.build(data[:, 0], data[:, 1], np.arange(len(field)))
+
+    supports_insert = False
+    supports_rect_query = False
+
+    def update_all(self, field: Field) -> None:
+        self.build(field)
+
+    def query_radius(self, xs: list[float], ys: list[float], radius: float) -> int:
+        offsets, _ = self.index.query_radius_batch(xs, ys, radius)
+        return int(offsets[-1])
+
+
+def make_variants() -> list[Any]:
+    return [
+        DynamicVariant("quadtree", lambda: QuadTree(BOUNDARY, capacity=8), True),
+        DynamicVariant(
+            "quadtree_loose",
+            lambda: QuadTree(BOUNDARY, capacity=8, looseness=1.25),
+            True,
+        ),
+        DynamicVariant("hash_grid", lambda: SpatialHashGrid(QUERY_RADIUS), False),
+        ArrayVariant("array_index", cell_size=QUERY_RADIUS),
+    ]
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _retained_bytes(variant: Any, field: Field) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    variant.build(field)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def _step(field: Field) -> Field:
+    return [
+        (
+            _clamp(x + dx * FRAME_DT, HALF_W),
+            _clamp(y + dy * FRAME_DT, HALF_H),
+            dx,
+            dy,
+        )
+        for x, y, dx, dy in field
+    ]
+
+
+def bench_variant(
+    variant: Any, distribution: str, field: Field, rng: random.Random
+) -> dict[str, Any]:
+    size = len(field)
+    result: dict[str, Any] = {
+        "index": variant.name,
+        "distribution": distribution,
+        "size": size,
+    }
+
+    result["memory_bytes"] = _retained_bytes(variant, field)
+    result["build_ms"] = _timed(lambda: variant.build(field))
+
+    sample = min(OPS_SAMPLE, size)
+    if variant.supports_insert:
+        extra = [
+            (size + i, rng.uniform(-HALF_W, HALF_W), rng.uniform(-HALF_H, HALF_H))
+            for i in range(sample)
+        ]
+        result["insert_us"] = (
+            _timed(lambda: [variant.insert(*args) for args in extra]) * 1000 / sample
+        )
+        victims = rng.sample(range(size), sample)
+        result["remove_us"] = (
+            _timed(lambda: [variant.remove(ent) for ent in victims]) * 1000 / sample
+        )
+        variant.build(field)
+    else:
+        result["insert_us"] = None
+        result["remove_us"] = None
+
+    moved = _step(field)
+    result["update_frame_ms"] = _timed(lambda: variant.update_all(moved))
+    variant.build(field)
+
+    xs = [rng.uniform(-HALF_W, HALF_W) for _ in range(QUERY_COUNT)]
+    ys = [rng.uniform(-HALF_H, HALF_H) for _ in range(QUERY_COUNT)]
+
+    if variant.supports_rect_query:
+        rects = [
+            Rectangle(x, y, QUERY_HALF_EXTENT, QUERY_HALF_EXTENT)
+            for x, y in zip(xs, ys)
+        ]
+        result["query_us"] = _timed(lambda: variant.query(rects)) * 1000 / QUERY_COUNT
+    else:
+        result["query_us"] = None
+
+    result["query_radius_us"] = (
+        _timed(lambda: variant.query_radius(xs, ys, QUERY_RADIUS)) * 1000 / QUERY_COUNT
+    )
+
+    return result
+
+
+def run(sizes: list[int], distributions: list[str], seed: int) -> list[dict[str, Any]]:
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            field = make_field(distribution, size, random.Random(seed))
+            for variant in make_variants():
+                rng = random.Random(seed + 1)
+                results.append(bench_variant(variant, distribution, field, rng))
+                print_row(results[-1])
+    return results
+
+
+COLUMNS = [
+    ("build_ms", "build ms"),
+    ("insert_us", "insert us"),
+    ("remove_us", "remove us"),
+    ("update_frame_ms", "update ms"),
+    ("query_us", "query us"),
+    ("query_radius_us", "radius us"),
+    ("memory_bytes", "memory KiB"),
+]
+
+
+def print_header() -> None:
+    header = f"{'index':<15} {'distribution':<12} {'size':>7}"
+    for _, title in COLUMNS:
+        header += f" {title:>11}"
+    print(header)
+
+
+def print_row(row: dict[str, Any]) -> None:
+    line = f"{row['index']:<15} {row['distribution']:<12} {row['size']:>7}"
+    for key, _ in COLUMNS:
+        value = row[key]
+        if value is None:
+            line += f" {'-':>11}"
+        elif key == "memory_bytes":
+            line += f" {value / 1024:>11.1f}"
+        else:
+            line += f" {value:>11.3f}"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--distributions", nargs="+", choices=DISTRIBUTIONS, default=DISTRIBUTIONS
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write machine-readable results to this file")
+    args = parser.parse_args()
+
+    print_header()
+    results = run(args.sizes, args.distributions, args.seed)
+
+    if args.json:
+        report = {
+            "meta": {
+                "timestamp": datetime.now(UTC).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "seed": args.seed,
+            },
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Wrote {len(results)} results to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
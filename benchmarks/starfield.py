@@ -0,0 +1,68 @@
+"""GPU time of the starfield background at different resolution scales.
+
+Draws ``src.rendering.Starfield`` for a run of frames at each scale and
+update rate and reports the mean frame time, including the wait for the
+GPU to finish. The ``clear`` row is the cost of clearing the window alone.
+Use a large window to see fill-rate effects::
+
+    ARCADE_HEADLESS=1 python -m benchmarks.starfield --size 2560 1440
+"""
+
+import argparse
+import time
+
+import arcade
+
+from src.rendering import Starfield
+
+FRAME_DT = 1 / 60
+
+VARIANTS: list[tuple[float, float | None]] = [
+    (1.0, None),
+    (0.5, None),
+    (0.25, None),
+    (0.5, 30.0),
+    (0.25, 30.0),
+]
+
+
+def bench(
+    window: arcade.Window, scale: float | None, rate: float | None, frames: int
+) -> float:
+    starfield = None
+    if scale is not None:
+        starfield = Starfield(window.ctx, window.get_framebuffer_size(), scale, rate)
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        window.clear()
+        if starfield is not None:
+            starfield.draw(frame * FRAME_DT)
+        window.ctx.finish()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, nargs=2, default=[1920, 1080])
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    window_width: int = args.size[0]
+    window_height: int = args.size[1]
+    window = arcade.Window(window_width, window_height, visible=False)
+    width, height = window.get_framebuffer_size()
+    print(f"{width}x{height} framebuffer, {args.frames} frames")
+    print(f"{'scale':>6} {'rate':>6} {'frame ms':>10}")
+    print(f"{'clear':>6} {'-':>6} {bench(window, None, None, args.frames):>10.3f}")
+
+    for scale, rate in VARIANTS:
+        bench(window, scale, rate, 5)  # compile shaders, allocate textures
+        elapsed = bench(window, scale, rate, args.frames)
+        print(f"{scale:>6} {rate or '-':>6} {elapsed:>10.3f}")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Atlas usage of runtime-generated chunk sprites.
+
+Spawns 10k resource chunks three ways and reports how many textures and
+images each leaves in the texture atlas:
+
+- ``per_sprite``: a freshly generated, pre-coloured circle texture per chunk
+- ``sprite_circle``: ``arcade.SpriteCircle`` as MiningProcessor used before
+- ``shape_cache``: ``create_circle_sprite`` from ``src.sprites``
+
+Needs an OpenGL context; set ``ARCADE_HEADLESS=1`` on machines without a
+display::
+
+    ARCADE_HEADLESS=1 python -m benchmarks.texture_atlas
+"""
+
+import random
+import time
+from collections.abc import Callable
+
+import arcade
+
+from src.sprites import create_circle_sprite
+
+CHUNK_COUNT = 10_000
+CHUNK_RADIUS = 3
+RESOURCE_COLORS = [
+    arcade.color.GRAY,
+    arcade.color.GOLD,
+    arcade.color.BLUE_GRAY,
+]
+
+
+def per_sprite(color: arcade.types.Color) -> arcade.Sprite:
+    return arcade.Sprite(arcade.make_circle_texture(CHUNK_RADIUS * 2, color))
+
+
+def sprite_circle(color: arcade.types.Color) -> arcade.Sprite:
+    return arcade.SpriteCircle(CHUNK_RADIUS, color)
+
+
+def shape_cache(color: arcade.types.Color) -> arcade.Sprite:
+    return create_circle_sprite(CHUNK_RADIUS, color)
+
+
+VARIANTS: list[tuple[str, Callable[[arcade.types.Color], arcade.Sprite]]] = [
+    ("per_sprite", per_sprite),
+    ("sprite_circle", sprite_circle),
+    ("shape_cache", shape_cache),
+]
+
+
+def bench(
+    window: arcade.Window,
+    factory: Callable[[arcade.types.Color], arcade.Sprite],
+) -> tuple[float, int, int, tuple[int, int]]:
+    atlas = arcade.DefaultTextureAtlas((256, 256))
+    sprite_list: arcade.SpriteList[arcade.Sprite] = arcade.SpriteList(atlas=atlas)
+    rng = random.Random(0)
+
+    start = time.perf_counter()
+    for _ in range(CHUNK_COUNT):
+        sprite = factory(rng.choice(RESOURCE_COLORS))
+        sprite.position = rng.uniform(-2000, 2000), rng.uniform(-2000, 2000)
+        sprite_list.append(sprite)
+    sprite_list.draw()
+    window.ctx.finish()
+    elapsed = time.perf_counter() - start
+
+    return elapsed * 1000, len(atlas.textures), len(atlas.images), atlas.size
+
+
+def main() -> None:
+    window = arcade.Window(64, 64, visible=False)
+
+    print(f"{CHUNK_COUNT} chunks")
+    print(
+        f"{'variant':<14} {'spawn ms':>10} {'textures':>9} {'images':>7} {'atlas':>11}"
+    )
+    for name, factory in VARIANTS:
+        elapsed, textures, images, (width, height) = bench(window, factory)
+        print(
+            f"{name:<14} {elapsed:>10.1f} {textures:>9} {images:>7}"
+            f" {f'{width}x{height}':>11}"
+        )
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#version 330
+
+in vec2 v_local;
+in vec4 v_color;
+out vec4 fragColor;
+
+void main() {
+    if (dot(v_local, v_local) > 1.0) {
+        discard;
+    }
+    fragColor = v_color;
+}
@@ -0,0 +1,30 @@
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+uniform float u_radius;
+uniform vec4 u_palette[8];
+
+// Corner of the unit quad
+in vec2 in_vert;
+
+// Per instance
+in vec2 in_pos;
+in float in_angle;  // degrees, clockwise like arcade.Sprite.angle
+in float in_color;  // palette index
+
+out vec2 v_local;
+out vec4 v_color;
+
+void main() {
+    float a = radians(-in_angle);
+    mat2 rotation = mat2(cos(a), sin(a), -sin(a), cos(a));
+    vec2 world = in_pos + rotation * (in_vert * u_radius);
+
+    gl_Position = window.projection * window.view * vec4(world, 0.0, 1.0);
+    v_local = in_vert;
+    v_color = u_palette[int(in_color)];
+}
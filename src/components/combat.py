@@ -8,6 +8,7 @@ class Turret(BaseComponent):
     cooldown: float = 1.0
     damage: int = 10
     last_shot_time: float = 0.0
+    target_id: int = -1  # Target of the last shot
 
 
 @component
@@ -1,14 +1,98 @@
+from typing import TYPE_CHECKING
+
 from src.components import component
 from src.components.base import BaseComponent
 
+if TYPE_CHECKING:
+    from src.systems.physics_store import PhysicsStore
+
 
-@component
 class Position(BaseComponent):
-    x: float
-    y: float
+    """World position of an entity.
+
+    While the entity also has a Velocity, MovementProcessor binds both
+    components to a slot of its PhysicsStore and they become views onto the
+    store's arrays. Reads and writes behave the same either way.
+    """
+
+    def __init__(self, x: float, y: float):
+        self._x = x
+        self._y = y
+        self._store: PhysicsStore | None = None
+        self._slot = -1
+
+    @property
+    def x(self) -> float:
+        if self._store is None:
+            return self._x
+        return float(self._store.x[self._slot])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        if self._store is None:
+            self._x = value
+        else:
+            self._store.x[self._slot] = value
+
+    @property
+    def y(self) -> float:
+        if self._store is None:
+            return self._y
+        return float(self._store.y[self._slot])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        if self._store is None:
+            self._y = value
+        else:
+            self._store.y[self._slot] = value
+
+    def __repr__(self) -> str:
+        return f"Position(x={self.x!r}, y={self.y!r})"
 
 
-@component
 class Velocity(BaseComponent):
-    dx: float
-    dy: float
+    """Velocity of an entity; see Position for how it is stored."""
+
+    def __init__(self, dx: float, dy: float):
+        self._dx = dx
+        self._dy = dy
+        self._store: PhysicsStore | None = None
+        self._slot = -1
+
+    @property
+    def dx(self) -> float:
+        if self._store is None:
+            return self._dx
+        return float(self._store.dx[self._slot])
+
+    @dx.setter
+    def dx(self, value: float) -> None:
+        if self._store is None:
+            self._dx = value
+        else:
+            self._store.dx[self._slot] = value
+
+    @property
+    def dy(self) -> float:
+        if self._store is None:
+            return self._dy
+        return float(self._store.dy[self._slot])
+
+    @dy.setter
+    def dy(self, value: float) -> None:
+        if self._store is None:
+            self._dy = value
+        else:
+            self._store.dy[self._slot] = value
+
+    def __repr__(self) -> str:
+        return f"Velocity(dx={self.dx!r}, dy={self.dy!r})"
+
+
+@component
+class Sleeping(BaseComponent):
+    """Body at rest. Its Velocity is removed while it sleeps, which takes it
+    out of MovementProcessor and every (..., Velocity) loop."""
+
+    since: float = 0.0
@@ -6,3 +6,13 @@ from src.components.base import BaseComponent
 @component
 class Renderable(BaseComponent):
     sprite: arcade.Sprite
+
+
+@component
+class Instance(BaseComponent):
+    """Drawn as one instance of RenderProcessor.instance_batches[batch]
+    rather than with a sprite of its own."""
+
+    batch: str
+    color: int = 0  # index into the batch's palette
+    angle: float = 0.0
@@ -16,10 +16,13 @@ def create_asteroid(
     res_type = random.choice(RESOURCE_TYPES)
     amount = random.randint(5, 50)
 
+    sprite = create_asteroid_sprite(sprite_list)
+    sprite.position = x, y
+
     asteroid = esper.create_entity(
         Position(x=x, y=y),
         Velocity(dx=dx, dy=dy),
-        Renderable(sprite=create_asteroid_sprite(sprite_list)),
+        Renderable(sprite=sprite),
         ResourceSource(resource_type=res_type, amount=amount, max_amount=amount),
     )
 
@@ -6,10 +6,13 @@ from src.sprites import SpriteListType, create_ship_sprite
 
 
 def create_player(x: float, y: float, sprite_list: SpriteListType) -> int:
+    sprite = create_ship_sprite(sprite_list)
+    sprite.position = x, y
+
     player = esper.create_entity(
         Position(x=x, y=y),
         Velocity(dx=0.0, dy=0.0),
-        Renderable(sprite=create_ship_sprite(sprite_list)),
+        Renderable(sprite=sprite),
         PlayerControl(speed=300.0),
         Inventory(),
     )
@@ -1,3 +1,5 @@
+from typing import TypedDict
+
 import arcade
 
 MAP_LIMIT_X = 2000
@@ -5,6 +7,16 @@ MAP_LIMIT_Y = 2000
 
 BUILD_RANGE = 300.0
 
+# Simulation runs at a fixed rate independent of the display refresh rate
+SIMULATION_TICK_RATE = 60
+# Steps run in one frame at most; time beyond that is dropped
+MAX_CATCH_UP_STEPS = 5
+
+# Starfield background resolution relative to the window (0.25 - 1.0), and
+# how many times per second it is re-rendered (None: every frame)
+BACKGROUND_SCALE = 0.5
+BACKGROUND_UPDATE_RATE: float | None = 30.0
+
 
 class BlockType:
     PLATFORM = 1
@@ -79,7 +91,24 @@ TOOLBAR_ITEMS = [
     BlockType.ASSEMBLER,
 ]
 
-RECIPES = {
+# Palette of resource chunks; resources not listed use the first colour
+RESOURCE_COLORS = [
+    arcade.color.YELLOW,
+    arcade.color.GRAY,
+    arcade.color.GOLD,
+    arcade.color.BLUE_GRAY,
+]
+RESOURCE_COLOR_INDEX = {"iron": 1, "gold": 2, "silicon": 3}
+
+
+class Recipe(TypedDict):
+    inputs: dict[str, int]
+    outputs: dict[str, int]
+    time: float
+    machine: int
+
+
+RECIPES: dict[str, Recipe] = {
     "iron_bar": {
         "inputs": {"iron": 1},
         "outputs": {"iron_bar": 1},
@@ -105,3 +134,25 @@ RECIPES = {
         "machine": BlockType.ASSEMBLER,
     },
 }
+
+# Lookups compiled from RECIPES once at import. Recipe lists keep RECIPES
+# order, which decides the recipe a factory starts when several are possible.
+MACHINE_RECIPES: dict[int, list[str]] = {
+    machine: [name for name, recipe in RECIPES.items() if recipe["machine"] == machine]
+    for machine in dict.fromkeys(recipe["machine"] for recipe in RECIPES.values())
+}
+MACHINE_INPUTS: dict[int, frozenset[str]] = {
+    machine: frozenset(item for name in names for item in RECIPES[name]["inputs"])
+    for machine, names in MACHINE_RECIPES.items()
+}
+MACHINE_OUTPUTS: dict[int, frozenset[str]] = {
+    machine: frozenset(item for name in names for item in RECIPES[name]["outputs"])
+    for machine, names in MACHINE_RECIPES.items()
+}
+# Machines with a recipe that consumes each item
+ITEM_CONSUMERS: dict[str, frozenset[int]] = {
+    item: frozenset(
+        machine for machine, inputs in MACHINE_INPUTS.items() if item in inputs
+    )
+    for item in frozenset().union(*MACHINE_INPUTS.values())
+}
@@ -10,10 +10,15 @@ from src.components.combat import Turret
 from src.components.logistics import Collector, Storage, DroneStation, Drone
 from src.components.production import Factory
 from src.systems.audio import AudioSystem
-from src.components.render import Renderable
+from src.components.render import Instance, Renderable
 from src.components.gameplay import Inventory, PlayerControl
 from src.processors import MouseProcessor, KeyboardProcessor
-from src.sprites import create_platform_tile, TILE_SIZE
+from src.rendering import ChunkedSpriteLayer, FloorChunkRenderer
+from src.sprites import (
+    create_solid_sprite,
+    platform_textures,
+    TILE_SIZE,
+)
 from src.game_data import (
     BlockType,
     BUILDING_RECIPES,
@@ -27,6 +32,8 @@ from src.systems.inventory import add_item, has_resources, remove_resources
 SCALE = 3.0
 ACTUAL_TILE_SIZE = TILE_SIZE * SCALE
 HALF_TILE_SIZE = ACTUAL_TILE_SIZE / 2
+# Floor and object layers are rendered in chunks of CHUNK_TILES^2 grid tiles
+CHUNK_TILES = 32
 CLICK_COOLDOWN = 0.15
 
 NEIGHBOR_OFFSETS = [
@@ -58,9 +65,8 @@ MASK_TO_TEXTURE_INDEX = {
 class BuilderProcessor(esper.Processor):
     def __init__(
         self,
-        floor_list: arcade.SpriteList,
-        object_list: arcade.SpriteList,
-        drone_list: arcade.SpriteList,
+        floor_list: ChunkedSpriteLayer,
+        object_list: ChunkedSpriteLayer,
         camera: arcade.Camera2D,
         mouse: MouseProcessor,
         keyboard: KeyboardProcessor,
@@ -68,7 +74,6 @@ class BuilderProcessor(esper.Processor):
         super().__init__()
         self.floor_list = floor_list
         self.object_list = object_list
-        self.drone_list = drone_list
         self.camera = camera
         self.mouse = mouse
         self.keyboard = keyboard
@@ -77,6 +82,14 @@ class BuilderProcessor(esper.Processor):
 
         self.selected_block = BlockType.PLATFORM
 
+        self.floor = FloorChunkRenderer(
+            floor_list,
+            [texture.image for texture in platform_textures],
+            TILE_SIZE,
+            SCALE,
+            CHUNK_TILES,
+        )
+
         self.ghost_sprite_list: arcade.SpriteList = arcade.SpriteList()
         self.ghost_sprite = arcade.SpriteSolidColor(
             int(ACTUAL_TILE_SIZE), int(ACTUAL_TILE_SIZE), color=arcade.color.WHITE
@@ -162,10 +175,7 @@ class BuilderProcessor(esper.Processor):
             self.ghost_sprite_list.draw()
 
     def _screen_to_grid(self) -> tuple[int, int]:
-        world_pos = self.camera.unproject((self.mouse.x, self.mouse.y))
-        gx = int(world_pos[0] // ACTUAL_TILE_SIZE)
-        gy = int(world_pos[1] // ACTUAL_TILE_SIZE)
-        return gx, gy
+        return self.mouse.frame.grid_x, self.mouse.frame.grid_y
 
     @staticmethod
     def _get_player_inventory() -> Inventory | None:
@@ -199,6 +209,7 @@ class BuilderProcessor(esper.Processor):
         layer = BLOCK_PROPERTIES[self.selected_block]["layer"]
         if layer == 0:
             world_map.floor_data[(gx, gy)] = self.selected_block
+            self._create_floor_entity(gx, gy)
             self.update_neighborhood(gx, gy)
         else:
             world_map.object_data[(gx, gy)] = self.selected_block
@@ -255,40 +266,40 @@ class BuilderProcessor(esper.Processor):
         if layer == 0:
             pass
         elif block_type == BlockType.TURRET:
-            sprite = arcade.SpriteSolidColor(
+            sprite = create_solid_sprite(
                 int(ACTUAL_TILE_SIZE * 0.8),  # Narrower
                 int(ACTUAL_TILE_SIZE * 0.4),  # Shorter/Narrower
-                color=arcade.color.ROCKET_METALLIC,
+                arcade.color.ROCKET_METALLIC,
             )
         elif block_type == BlockType.COLLECTOR:
-            sprite = arcade.SpriteSolidColor(
+            sprite = create_solid_sprite(
                 int(ACTUAL_TILE_SIZE),
                 int(ACTUAL_TILE_SIZE),
-                color=arcade.color.ORANGE_PEEL,
+                arcade.color.ORANGE_PEEL,
             )
         elif block_type == BlockType.STORAGE:
-            sprite = arcade.SpriteSolidColor(
+            sprite = create_solid_sprite(
                 int(ACTUAL_TILE_SIZE),
                 int(ACTUAL_TILE_SIZE),
-                color=arcade.color.DARK_BROWN,
+                arcade.color.DARK_BROWN,
             )
         elif block_type == BlockType.DRONE_STATION:
-            sprite = arcade.SpriteSolidColor(
+            sprite = create_solid_sprite(
                 int(ACTUAL_TILE_SIZE),
                 int(ACTUAL_TILE_SIZE),
-                color=arcade.color.AIR_FORCE_BLUE,
+                arcade.color.AIR_FORCE_BLUE,
             )
         elif block_type == BlockType.SMELTER:
-            sprite = arcade.SpriteSolidColor(
+            sprite = create_solid_sprite(
                 int(ACTUAL_TILE_SIZE),
                 int(ACTUAL_TILE_SIZE),
-                color=arcade.color.RED_DEVIL,
+                arcade.color.RED_DEVIL,
             )
         elif block_type == BlockType.ASSEMBLER:
-            sprite = arcade.SpriteSolidColor(
+            sprite = create_solid_sprite(
                 int(ACTUAL_TILE_SIZE),
                 int(ACTUAL_TILE_SIZE),
-                color=arcade.color.GREEN,
+                arcade.color.GREEN,
             )
 
         if not sprite:
@@ -337,8 +348,10 @@ class BuilderProcessor(esper.Processor):
             ent_id = world_map.entity_map.pop(key)
             if esper.entity_exists(ent_id):
                 try:
-                    sprite_comp = esper.component_for_entity(ent_id, Renderable)
-                    sprite_comp.sprite.remove_from_sprite_lists()
+                    # Floor tiles have no sprite of their own
+                    sprite_comp = esper.try_component(ent_id, Renderable)
+                    if sprite_comp is not None:
+                        sprite_comp.sprite.remove_from_sprite_lists()
 
                     # Check for linked drone
                     if esper.has_component(ent_id, DroneStation):
@@ -346,12 +359,6 @@ class BuilderProcessor(esper.Processor):
                         if station.drone_id != -1 and esper.entity_exists(
                             station.drone_id
                         ):
-                            # Remove drone sprite
-                            if esper.has_component(station.drone_id, Renderable):
-                                drone_rend = esper.component_for_entity(
-                                    station.drone_id, Renderable
-                                )
-                                drone_rend.sprite.remove_from_sprite_lists()
                             esper.delete_entity(station.drone_id)
 
                     esper.delete_entity(ent_id)
@@ -359,33 +366,41 @@ class BuilderProcessor(esper.Processor):
                     pass
 
     def update_neighborhood(self, gx, gy) -> None:
+        # A tile's texture depends on its neighbours, which may sit in the
+        # next chunk over.
         for dx, dy in [(0, 0), (0, 1), (0, -1), (1, 0), (-1, 0)]:
-            self._update_single_floor_visuals(gx + dx, gy + dy)
+            self.floor.mark_dirty(gx + dx, gy + dy)
+        self._bake_floor()
 
-    def _update_single_floor_visuals(self, gx: int, gy: int) -> None:
+    def _bake_floor(self) -> None:
         world_map = self.get_world_map()
         if not world_map:
             return
 
-        if (gx, gy) not in world_map.floor_data:
-            return
+        self.floor.bake(
+            lambda gx, gy: self._floor_texture_index(world_map.floor_data, gx, gy)
+        )
+
+    @staticmethod
+    def _floor_texture_index(
+        floor_data: dict[tuple[int, int], int], gx: int, gy: int
+    ) -> int | None:
+        if (gx, gy) not in floor_data:
+            return None
+
         mask = 0
         for dx, dy, bit_val in NEIGHBOR_OFFSETS:
-            if (gx + dx, gy + dy) in world_map.floor_data:
+            if (gx + dx, gy + dy) in floor_data:
                 mask += bit_val
 
-        texture_idx = MASK_TO_TEXTURE_INDEX.get(mask, 0)
-        self._remove_entity(gx, gy, 0)
+        return MASK_TO_TEXTURE_INDEX.get(mask, 0)
 
-        pixel_x = gx * ACTUAL_TILE_SIZE + HALF_TILE_SIZE
-        pixel_y = gy * ACTUAL_TILE_SIZE + HALF_TILE_SIZE
+    def _create_floor_entity(self, gx: int, gy: int) -> None:
+        world_map = self.get_world_map()
+        if not world_map:
+            return
 
-        sprite = create_platform_tile(
-            self.floor_list, texture_idx, pixel_x, pixel_y, scale=SCALE
-        )
-        ent = esper.create_entity(
-            GridPosition(gx, gy), MapTag(BlockType.PLATFORM), Renderable(sprite=sprite)
-        )
+        ent = esper.create_entity(GridPosition(gx, gy), MapTag(BlockType.PLATFORM))
         world_map.entity_map[(gx, gy, 0)] = ent
 
     def refresh_visuals(self):
@@ -398,8 +413,11 @@ class BuilderProcessor(esper.Processor):
                 esper.delete_entity(ent_id)
         world_map.entity_map.clear()
 
+        self.floor.clear()
         for gx, gy in world_map.floor_data.keys():
-            self._update_single_floor_visuals(gx, gy)
+            self._create_floor_entity(gx, gy)
+            self.floor.mark_dirty(gx, gy)
+        self._bake_floor()
 
         for (gx, gy), type_id in world_map.object_data.items():
             self._create_entity(gx, gy, type_id, layer=1)
@@ -408,13 +426,8 @@ class BuilderProcessor(esper.Processor):
         x = gx * ACTUAL_TILE_SIZE + HALF_TILE_SIZE
         y = gy * ACTUAL_TILE_SIZE + HALF_TILE_SIZE
 
-        sprite = arcade.SpriteCircle(5, arcade.color.WHITE)
-        sprite.center_x = x
-        sprite.center_y = y
-        self.drone_list.append(sprite)
-
         drone_ent = esper.create_entity(
-            Position(x, y), Renderable(sprite=sprite), Drone(station_id=station_id)
+            Position(x, y), Instance("drones"), Drone(station_id=station_id)
         )
 
         # Link station to drone
@@ -3,8 +3,8 @@ import esper
 from arcade.math import lerp_2d
 from pyglet.math import Vec2
 
-from src.components.physics import Position
 from src.components.gameplay import PlayerControl
+from src.components.render import Renderable
 from src.processors.keyboard import KeyboardProcessor
 from src.processors.mouse import MouseProcessor
 
@@ -20,11 +20,13 @@ class CameraProcessor(esper.Processor):
         camera: arcade.Camera2D,
         keyboard: KeyboardProcessor,
         mouse: MouseProcessor,
+        grid_size: float,
     ):
         super().__init__()
         self.camera = camera
         self.keyboard = keyboard
         self.mouse = mouse
+        self.grid_size = grid_size
         self.target_zoom = camera.zoom
 
     def process(self, dt: float):
@@ -33,8 +35,10 @@ class CameraProcessor(esper.Processor):
         target_pos = self.camera.position
 
         player_found = False
-        for ent, (pos, ctrl) in esper.get_components(Position, PlayerControl):
-            target_pos = Vec2(pos.x, pos.y)
+        # Follow the interpolated sprite rather than the simulated position,
+        # which only advances on simulation ticks.
+        for ent, (renderable, ctrl) in esper.get_components(Renderable, PlayerControl):
+            target_pos = Vec2(*renderable.sprite.position)
             player_found = True
             break
 
@@ -49,6 +53,27 @@ class CameraProcessor(esper.Processor):
         diff = self.target_zoom - self.camera.zoom
         self.camera.zoom += diff * lerp_t
 
+        self.update_input_frame()
+
+    def update_input_frame(self) -> None:
+        """Recompute mouse.frame from the cursor and the current camera."""
+        frame = self.mouse.frame
+        camera = self.camera
+
+        frame.screen_x = self.mouse.x
+        frame.screen_y = self.mouse.y
+        frame.world_x, frame.world_y, _ = camera.unproject((self.mouse.x, self.mouse.y))
+        frame.grid_x = int(frame.world_x // self.grid_size)
+        frame.grid_y = int(frame.world_y // self.grid_size)
+
+        x, y = camera.position
+        frame.view = arcade.LRBT(
+            x + camera.left,
+            x + camera.right,
+            y + camera.bottom,
+            y + camera.top,
+        )
+
     def _handle_mouse_zoom(self):
         if self.mouse.scroll_y == 0:
             return
@@ -1,39 +1,52 @@
 import arcade
 import esper
 import math
+import numpy as np
 
 from src.components.combat import Turret, Projectile
 from src.components.gameplay import ResourceSource
 from src.components.physics import Velocity, Position
 from src.components.render import Renderable
 from src.processors.mining import MiningProcessor
+from src.rendering import BeamBatch
+from src.rendering.beams import DrawPositionFn
 from src.systems.audio import AudioSystem
-from src.spatial.quadtree import QuadTree, Point, Rectangle
-from src.game_data import MAP_LIMIT_X, MAP_LIMIT_Y
+from src.spatial.array_index import ArraySpatialIndex
+from src.sprites import SpritePool
+from src.systems.spatial_index import SpatialIndexService
+
+TRACER_COLOR = (255, 255, 0, 120)
+TRACER_WIDTH = 1.0
+# Seconds a tracer stays visible after a shot
+TRACER_DURATION = 0.15
 
 
 class CombatProcessor(esper.Processor):
-    def __init__(self, mining: MiningProcessor, sprite_list: arcade.SpriteList):
+    def __init__(
+        self,
+        mining: MiningProcessor,
+        projectile_pool: SpritePool,
+        spatial: SpatialIndexService,
+        batched_targeting: bool = False,
+    ):
         super().__init__()
         self.mining = mining
-        self.sprite_list = sprite_list
+        self.projectile_pool = projectile_pool
+        self.spatial = spatial
 
-        boundary = Rectangle(0, 0, MAP_LIMIT_X * 1.5, MAP_LIMIT_Y * 1.5)
-        self.asteroid_tree = QuadTree(boundary, capacity=8)
+        # Batched targeting answers every ready turret with one vectorized
+        # query per frame; it pays off with large turret counts.
+        self.batched_targeting = batched_targeting
+        self.asteroid_array = ArraySpatialIndex(cell_size=Turret.range)
 
     def process(self, dt: float):
-        self._rebuild_asteroid_tree()
+        if self.batched_targeting:
+            self._process_turrets_batched(dt)
+        else:
+            self._process_turrets(dt)
 
-        self._process_turrets(dt)
         self._process_projectiles(dt)
 
-    def _rebuild_asteroid_tree(self):
-        self.asteroid_tree.clear()
-
-        for ent, (res, pos) in esper.get_components(ResourceSource, Position):
-            point = Point(pos.x, pos.y, ent)
-            self.asteroid_tree.insert(point)
-
     def _process_turrets(self, dt: float):
         for ent, (turret, pos, renderable) in esper.get_components(
             Turret, Position, Renderable
@@ -43,24 +56,62 @@ class CombatProcessor(esper.Processor):
             if turret.last_shot_time < turret.cooldown:
                 continue
 
-            candidates = self.asteroid_tree.query_radius(pos.x, pos.y, turret.range)
+            target = self.spatial.asteroids.nearest(pos.x, pos.y, turret.range)
 
-            target_id = -1
-            min_dist = turret.range
+            if target is not None:
+                self._fire_turret(ent, turret, pos, renderable, target.entity_id)
 
-            for candidate_id in candidates:
-                if not esper.entity_exists(candidate_id):
-                    continue
+    def _process_turrets_batched(self, dt: float):
+        ready = []
+        for ent, (turret, pos, renderable) in esper.get_components(
+            Turret, Position, Renderable
+        ):
+            turret.last_shot_time += dt
 
-                target_pos = esper.component_for_entity(candidate_id, Position)
-                dist = math.hypot(target_pos.x - pos.x, target_pos.y - pos.y)
-                if dist < min_dist:
-                    min_dist = dist
-                    target_id = candidate_id
+            if turret.last_shot_time >= turret.cooldown:
+                ready.append((ent, turret, pos, renderable))
+
+        if not ready:
+            return
+
+        self._build_asteroid_array()
 
+        target_ids = self.asteroid_array.nearest_batch(
+            [pos.x for _, _, pos, _ in ready],
+            [pos.y for _, _, pos, _ in ready],
+            [turret.range for _, turret, _, _ in ready],
+        )
+
+        for (ent, turret, pos, renderable), target_id in zip(
+            ready, target_ids.tolist()
+        ):
             if target_id != -1:
                 self._fire_turret(ent, turret, pos, renderable, target_id)
 
+    @staticmethod
+    def add_tracers(beams: BeamBatch, draw_position: DrawPositionFn):
+        """Add a line from each turret to its target right after a shot."""
+        for ent, (turret, pos) in esper.get_components(Turret, Position):
+            if turret.last_shot_time >= TRACER_DURATION:
+                continue
+
+            target = draw_position(turret.target_id)
+            if target is not None:
+                beams.add(pos.x, pos.y, *target, TRACER_COLOR, TRACER_WIDTH)
+
+    def _build_asteroid_array(self):
+        asteroids = [
+            (ent, pos)
+            for ent, (res, pos) in esper.get_components(ResourceSource, Position)
+            if res.amount > 0
+        ]
+
+        self.asteroid_array.build(
+            np.fromiter((pos.x for _, pos in asteroids), np.float64, len(asteroids)),
+            np.fromiter((pos.y for _, pos in asteroids), np.float64, len(asteroids)),
+            np.fromiter((ent for ent, _ in asteroids), np.int64, len(asteroids)),
+        )
+
     @staticmethod
     def _calculate_intercept(
         tx: float,  # turret
@@ -106,6 +157,7 @@ class CombatProcessor(esper.Processor):
 
     def _fire_turret(self, turret_ent, turret, pos, renderable, target_id):
         turret.last_shot_time = 0.0
+        turret.target_id = target_id
         speed = 100.0
 
         target_pos = esper.component_for_entity(target_id, Position)
@@ -134,10 +186,7 @@ class CombatProcessor(esper.Processor):
 
         renderable.sprite.angle = -math.degrees(angle)
 
-        sprite = arcade.SpriteCircle(5, arcade.color.YELLOW)
-        sprite.center_x = pos.x
-        sprite.center_y = pos.y
-        self.sprite_list.append(sprite)
+        sprite = self.projectile_pool.acquire(pos.x, pos.y, arcade.color.YELLOW)
 
         vel_x = math.cos(angle) * speed
         vel_y = math.sin(angle) * speed
@@ -183,6 +232,9 @@ class CombatProcessor(esper.Processor):
                 self.mining.spawn_chunk(
                     target_pos.x, target_pos.y, res.resource_type, to_receive
                 )
+                self.mining.spawn_particles(
+                    target_pos.x, target_pos.y, res.resource_type
+                )
 
                 if res.amount <= 0 and esper.entity_exists(proj.target_id):
                     try:
@@ -191,6 +243,7 @@ class CombatProcessor(esper.Processor):
                         )
                         target_rend.sprite.remove_from_sprite_lists()
                         esper.delete_entity(proj.target_id)
+                        self.spatial.asteroids.remove(proj.target_id)
                     except KeyError:
                         pass
             except KeyError:
@@ -198,7 +251,6 @@ class CombatProcessor(esper.Processor):
 
         self._destroy_projectile(proj_ent, renderable)
 
-    @staticmethod
-    def _destroy_projectile(ent, renderable):
-        renderable.sprite.remove_from_sprite_lists()
+    def _destroy_projectile(self, ent, renderable):
+        self.projectile_pool.release(renderable.sprite)
         esper.delete_entity(ent)
@@ -1,5 +1,5 @@
-import arcade
 import esper
+import heapq
 import math
 
 from src.components.logistics import (
@@ -9,24 +9,58 @@ from src.components.logistics import (
     Storage,
 )
 from src.components.gameplay import Inventory, PlayerControl
-from src.components.physics import Position, Velocity
+from src.components.physics import Position, Sleeping, Velocity
 from src.components.production import Factory
 from src.components.map import MapTag
-from src.components.render import Renderable
-from src.game_data import RECIPES
+from src.components.render import Instance
+from src.game_data import (
+    ITEM_CONSUMERS,
+    MACHINE_INPUTS,
+    MACHINE_OUTPUTS,
+    MACHINE_RECIPES,
+    RECIPES,
+)
+from src.rendering import BeamBatch
+from src.rendering.beams import DrawPositionFn
+from src.spatial.hash_grid import SpatialHashGrid
+from src.spatial.quadtree import Point
 from src.systems.inventory import add_item, remove_resources
+from src.systems.spatial_index import SpatialIndexService
+
+# Chunks slower than this (px/s) with no collector in range fall asleep
+SLEEP_SPEED = 1.0
+
+TETHER_COLOR = (255, 255, 255, 40)
+TETHER_WIDTH = 1.0
 
 
 class LogisticsProcessor(esper.Processor):
-    def __init__(self, drone_list: arcade.SpriteList):
+    def __init__(self, spatial: SpatialIndexService):
         super().__init__()
-        self.drone_list = drone_list
+        self.spatial = spatial
+        self.collector_grid = SpatialHashGrid(Collector.range)
+
+        # Sleeping chunks, indexed so collectors can find and wake them
+        self.clock = 0.0
+        self.sleeping: dict[int, Sleeping] = {}
+        self.sleeping_grid = SpatialHashGrid(Collector.range)
+        self.sleep_expiry: list[tuple[float, int, float]] = []
+
+        # Inputs of the built factories, recomputed when factories come or go
+        self._factories: list | None = None
+        self._needed_resources: frozenset[str] = frozenset()
+
+        # Source lookups that found nothing this tick. They do not depend on
+        # the drone, so the other idle drones skip them until the next tick
+        # instead of walking every structure of that kind again.
+        self._exhausted: set[str] = set()
 
     def process(self, dt: float):
         self._process_chunks(dt)
         self._process_drones(dt)
 
     def _process_chunks(self, dt: float):
+        self.clock += dt
         chunks_to_destroy = []
 
         # Get all collectors (including player)
@@ -44,15 +78,14 @@ class LogisticsProcessor(esper.Processor):
             player_collector = Collector(range=100.0, pull_speed=400.0)
             collectors.append((ent, player_collector, pos, inv))  # type: ignore
 
-        for chunk_ent, (
-            chunk,
-            chunk_pos,
-            chunk_vel,
-            chunk_rend,
-        ) in esper.get_components(ResourceChunk, Position, Velocity, Renderable):
+        max_range = self._index_collectors(collectors)
+
+        for chunk_ent, (chunk, chunk_pos, chunk_vel) in esper.get_components(
+            ResourceChunk, Position, Velocity
+        ):
             chunk.lifetime -= dt
             if chunk.lifetime <= 0:
-                chunks_to_destroy.append((chunk_ent, chunk_rend))
+                chunks_to_destroy.append(chunk_ent)
                 continue
 
             # Apply drag
@@ -65,17 +98,22 @@ class LogisticsProcessor(esper.Processor):
             closest_collector = None
             min_dist = float("inf")
 
-            for col_ent, col, col_pos, col_inv in collectors:
+            # Grid keys are indices into `collectors`; sorting them keeps the
+            # original iteration order so ties resolve exactly as before.
+            nearby = self.collector_grid.query_radius(
+                chunk_pos.x, chunk_pos.y, max_range
+            )
+            nearby.sort()
+
+            for col_index in nearby:
+                col_ent, col, col_pos, col_inv = collectors[col_index]
                 dist = math.hypot(col_pos.x - chunk_pos.x, col_pos.y - chunk_pos.y)
 
                 if dist < col.range:
                     # Check if collector has space (skip if full)
                     if col_inv is None:  # Block collector (not player)
-                        if esper.has_component(col_ent, Inventory):
-                            inv = esper.component_for_entity(col_ent, Inventory)
-                            total = sum(inv.resources.values())
-                            if total >= col.capacity:
-                                continue  # Collector full
+                        if self._collector_full(col_ent, col):
+                            continue
                     else:
                         # This is the player - give priority
                         if dist < 20:  # Player collection radius
@@ -90,18 +128,18 @@ class LogisticsProcessor(esper.Processor):
             if player_collector:
                 col_ent, col, col_pos, col_inv = player_collector
                 chunk.claimed_by = col_ent  # Override any claim
-                
+
                 # Pull towards player
                 angle = math.atan2(col_pos.y - chunk_pos.y, col_pos.x - chunk_pos.x)
                 chunk_vel.dx += math.cos(angle) * col.pull_speed * dt
                 chunk_vel.dy += math.sin(angle) * col.pull_speed * dt
-                
+
                 # Collect immediately if close
                 dist = math.hypot(col_pos.x - chunk_pos.x, col_pos.y - chunk_pos.y)
                 if dist < 20:
                     if self._collect_chunk(chunk_ent, chunk, col_ent, col_inv):
-                        chunks_to_destroy.append((chunk_ent, chunk_rend))
-            
+                        chunks_to_destroy.append(chunk_ent)
+
             # Otherwise, use normal collector claiming
             elif closest_collector:
                 col_ent, col, col_pos, col_inv = closest_collector
@@ -118,10 +156,96 @@ class LogisticsProcessor(esper.Processor):
                     # Collection radius
                     if min_dist < 20:
                         if self._collect_chunk(chunk_ent, chunk, col_ent, col_inv):
-                            chunks_to_destroy.append((chunk_ent, chunk_rend))
+                            chunks_to_destroy.append(chunk_ent)
+
+            elif math.hypot(chunk_vel.dx, chunk_vel.dy) < SLEEP_SPEED:
+                # Nothing moves this chunk until a collector comes in range
+                self._sleep_chunk(chunk_ent, chunk, chunk_pos)
+
+        for ent in chunks_to_destroy:
+            self._destroy_chunk(ent)
+
+        # Chunks put to sleep or woken here join the loop above next tick,
+        # so their lifetime is counted exactly once per tick.
+        self._expire_sleeping_chunks()
+        self._wake_chunks(collectors)
+
+    def _sleep_chunk(self, ent: int, chunk: ResourceChunk, pos: Position):
+        sleeping = Sleeping(since=self.clock)
+        esper.remove_component(ent, Velocity)
+        esper.add_component(ent, sleeping)
+
+        self.sleeping[ent] = sleeping
+        self.sleeping_grid.insert(Point(pos.x, pos.y, ent))
+        heapq.heappush(
+            self.sleep_expiry, (self.clock + chunk.lifetime, ent, sleeping.since)
+        )
+
+    def _wake_chunks(self, collectors):
+        if not self.sleeping:
+            return
+
+        for col_ent, col, col_pos, col_inv in collectors:
+            if col_inv is None and self._collector_full(col_ent, col):
+                continue
+
+            for ent in self.sleeping_grid.query_radius(col_pos.x, col_pos.y, col.range):
+                sleeping = self._forget_sleeping(ent)
+                if sleeping is None:
+                    continue
+
+                chunk = esper.component_for_entity(ent, ResourceChunk)
+                chunk.lifetime -= self.clock - sleeping.since
+                esper.remove_component(ent, Sleeping)
+                esper.add_component(ent, Velocity(0.0, 0.0))
+
+    def _expire_sleeping_chunks(self):
+        while self.sleep_expiry and self.sleep_expiry[0][0] <= self.clock:
+            _, ent, since = heapq.heappop(self.sleep_expiry)
+
+            sleeping = self.sleeping.get(ent)
+            if sleeping is None or sleeping.since != since:
+                continue  # Woken since, or a newer sleep of a reused id
+
+            if self._forget_sleeping(ent) is not None:
+                self._destroy_chunk(ent)
+
+    def _forget_sleeping(self, ent: int) -> Sleeping | None:
+        """Drop ent from the sleeping index.
+
+        Returns its Sleeping component, or None when the entity was deleted
+        (or the database cleared) while it slept.
+        """
+        sleeping = self.sleeping.pop(ent)
+        self.sleeping_grid.remove(ent)
+
+        if not esper.entity_exists(ent):
+            return None
+        if esper.try_component(ent, Sleeping) is not sleeping:
+            return None
+        return sleeping
+
+    @staticmethod
+    def _collector_full(col_ent: int, col: Collector) -> bool:
+        if esper.has_component(col_ent, Inventory):
+            inv = esper.component_for_entity(col_ent, Inventory)
+            total = sum(inv.resources.values())
+            if total >= col.capacity:
+                return True
+        return False
+
+    def _index_collectors(self, collectors) -> float:
+        max_range = max((col.range for _, col, _, _ in collectors), default=0.0)
+
+        if max_range > 0 and max_range != self.collector_grid.cell_size:
+            self.collector_grid = SpatialHashGrid(max_range)
+        else:
+            self.collector_grid.clear()
+
+        for i, (_, _, col_pos, _) in enumerate(collectors):
+            self.collector_grid.insert(Point(col_pos.x, col_pos.y, i))
 
-        for ent, rend in chunks_to_destroy:
-            self._destroy_chunk(ent, rend)
+        return max_range
 
     @staticmethod
     def _collect_chunk(chunk_ent, chunk, col_ent, col_inv):
@@ -147,22 +271,31 @@ class LogisticsProcessor(esper.Processor):
         return False
 
     @staticmethod
-    def _destroy_chunk(ent, renderable):
-        renderable.sprite.remove_from_sprite_lists()
+    def _destroy_chunk(ent):
         esper.delete_entity(ent)
 
     def _process_drones(self, dt: float):
-        for ent, (drone, pos, renderable) in esper.get_components(
-            Drone, Position, Renderable
+        self._exhausted.clear()
+        for ent, (drone, pos, instance) in esper.get_components(
+            Drone, Position, Instance
         ):
             if drone.state == "IDLE":
                 self._handle_idle(ent, drone, pos)
             elif drone.state == "MOVING_TO_SOURCE":
-                self._handle_moving_to_source(dt, ent, drone, pos, renderable)
+                self._handle_moving_to_source(dt, ent, drone, pos, instance)
             elif drone.state == "MOVING_TO_TARGET":
-                self._handle_moving_to_target(dt, ent, drone, pos, renderable)
+                self._handle_moving_to_target(dt, ent, drone, pos, instance)
             elif drone.state == "RETURNING_TO_STATION":
-                self._handle_returning_to_station(dt, ent, drone, pos, renderable)
+                self._handle_returning_to_station(dt, ent, drone, pos, instance)
+
+    @staticmethod
+    def add_tethers(beams: BeamBatch, draw_position: DrawPositionFn):
+        """Add a line from each drone to its station."""
+        for ent, drone in esper.get_component(Drone):
+            start = draw_position(drone.station_id)
+            end = draw_position(ent)
+            if start is not None and end is not None:
+                beams.add(*start, *end, TETHER_COLOR, TETHER_WIDTH)
 
     def _handle_idle(self, ent, drone, pos):
         # If drone has items, try to find a target (wait for storage/factory)
@@ -187,13 +320,13 @@ class LogisticsProcessor(esper.Processor):
                 if dist > 10.0:
                     drone.state = "RETURNING_TO_STATION"
 
-    def _handle_moving_to_source(self, dt, ent, drone, pos, renderable):
+    def _handle_moving_to_source(self, dt, ent, drone, pos, instance):
         if not esper.entity_exists(drone.source_id):
             drone.state = "IDLE"
             return
 
         target_pos = esper.component_for_entity(drone.source_id, Position)
-        if self._move_towards(dt, pos, target_pos, drone.speed, renderable):
+        if self._move_towards(dt, pos, target_pos, drone.speed, instance):
             # Arrived
             self._take_items(drone, drone.source_id)
 
@@ -205,28 +338,28 @@ class LogisticsProcessor(esper.Processor):
             else:
                 drone.state = "IDLE"
 
-    def _handle_moving_to_target(self, dt, ent, drone, pos, renderable):
+    def _handle_moving_to_target(self, dt, ent, drone, pos, instance):
         if not esper.entity_exists(drone.target_id):
             drone.state = "IDLE"
             return
 
         target_pos = esper.component_for_entity(drone.target_id, Position)
-        if self._move_towards(dt, pos, target_pos, drone.speed, renderable):
+        if self._move_towards(dt, pos, target_pos, drone.speed, instance):
             # Arrived
             self._deposit_items(drone, drone.target_id)
             drone.state = "IDLE"
 
-    def _handle_returning_to_station(self, dt, ent, drone, pos, renderable):
+    def _handle_returning_to_station(self, dt, ent, drone, pos, instance):
         if not esper.entity_exists(drone.station_id):
             drone.state = "IDLE"
             return
 
         target_pos = esper.component_for_entity(drone.station_id, Position)
-        if self._move_towards(dt, pos, target_pos, drone.speed, renderable):
+        if self._move_towards(dt, pos, target_pos, drone.speed, instance):
             drone.state = "IDLE"
 
     @staticmethod
-    def _move_towards(dt, current_pos, target_pos, speed, renderable):
+    def _move_towards(dt, current_pos, target_pos, speed, instance):
         dx = target_pos.x - current_pos.x
         dy = target_pos.y - current_pos.y
         dist = math.hypot(dx, dy)
@@ -238,159 +371,138 @@ class LogisticsProcessor(esper.Processor):
         current_pos.x += math.cos(angle) * speed * dt
         current_pos.y += math.sin(angle) * speed * dt
 
-        renderable.sprite.center_x = current_pos.x
-        renderable.sprite.center_y = current_pos.y
-        renderable.sprite.angle = math.degrees(angle) - 90
+        instance.angle = math.degrees(angle) - 90
 
         return False
 
-    @staticmethod
-    def _find_source(pos):
-        best_id = -1
-        min_dist = float("inf")
-
+    def _find_source(self, pos):
         # 1. Check Collectors (High Priority)
-        for ent, (col, inv, col_pos) in esper.get_components(
-            Collector, Inventory, Position
-        ):
-            if not inv.resources:
-                continue
-
-            dist = math.hypot(col_pos.x - pos.x, col_pos.y - pos.y)
-            if dist < min_dist:
-                min_dist = dist
-                best_id = ent
-
-        if best_id != -1:
-            return best_id
-
-        for ent, (factory, inv, factory_pos, tag) in esper.get_components(
-            Factory, Inventory, Position, MapTag
-        ):
-            if not inv.resources:
-                continue
-
-            machine_type = tag.cell_type
-
-            # Determine valid inputs for this machine
-            valid_inputs = set()
-            for recipe_name, data in RECIPES.items():
-                if data["machine"] == machine_type:
-                    for input_item in data["inputs"]:
-                        valid_inputs.add(input_item)
-
-            # Check if there are any items that are NOT valid inputs (i.e., outputs)
-            has_output = False
-            for res in inv.resources:
-                if res not in valid_inputs:
-                    has_output = True
-                    break
-
-            if has_output:
-                dist = math.hypot(factory_pos.x - pos.x, factory_pos.y - pos.y)
-                if dist < min_dist:
-                    min_dist = dist
-                    best_id = ent
-
-        if best_id != -1:
-            return best_id
-
-        needed_resources = set()
-        for ent, (factory, inv, tag) in esper.get_components(
-            Factory, Inventory, MapTag
-        ):
-            machine_type = tag.cell_type
-            for recipe_name, data in RECIPES.items():
-                if data["machine"] == machine_type:
-                    for input_item in data["inputs"]:
-                        # If factory needs this item (simple check, not checking amount)
-                        needed_resources.add(input_item)
+        def is_loaded_collector(ent):
+            inv = esper.try_component(ent, Inventory)
+            return inv is not None and bool(inv.resources)
+
+        collector = self._nearest_source(
+            "collectors", self.spatial.collectors, pos, is_loaded_collector
+        )
+        if collector != -1:
+            return collector
+
+        # 2. Factories holding outputs
+        def has_output(ent):
+            inv = esper.try_component(ent, Inventory)
+            tag = esper.try_component(ent, MapTag)
+            if inv is None or tag is None or not inv.resources:
+                return False
+
+            outputs = MACHINE_OUTPUTS.get(tag.cell_type, frozenset())
+            return not outputs.isdisjoint(inv.resources)
+
+        factory = self._nearest_source(
+            "factories", self.spatial.factories, pos, has_output
+        )
+        if factory != -1:
+            return factory
+
+        needed_resources = self._factory_inputs()
 
         if not needed_resources:
             return -1
 
-        for ent, (store, inv, store_pos) in esper.get_components(
-            Storage, Inventory, Position
-        ):
-            if not inv.resources:
-                continue
+        # 3. Storages holding something a factory needs
+        def has_needed(ent):
+            inv = esper.try_component(ent, Inventory)
+            if inv is None:
+                return False
 
-            # Check if storage has any needed resource
-            has_needed = False
             for res in inv.resources:
                 if res in needed_resources:
-                    has_needed = True
-                    break
+                    return True
+            return False
 
-            if not has_needed:
-                continue
+        return self._nearest_source("storages", self.spatial.storages, pos, has_needed)
 
-            dist = math.hypot(store_pos.x - pos.x, store_pos.y - pos.y)
-            if dist < min_dist:
-                min_dist = dist
-                best_id = ent
+    def _nearest_source(self, kind, layer, pos, predicate) -> int:
+        """Nearest structure of ``layer`` matching ``predicate``, or -1.
 
-        return best_id
+        A miss is remembered under ``kind`` for the rest of the tick.
+        """
+        if kind in self._exhausted:
+            return -1
 
-    @staticmethod
-    def _find_target(pos, drone):
-        best_id = -1
-        min_dist = float("inf")
+        point = layer.nearest(pos.x, pos.y, predicate=predicate)
+        if point is None:
+            self._exhausted.add(kind)
+            return -1
+        return point.entity_id
+
+    def _factory_inputs(self) -> frozenset[str]:
+        """Items some built factory has a recipe for (not checking amount)."""
+        factories = esper.get_components(Factory, Inventory, MapTag)
+        if factories is not self._factories:
+            self._factories = factories
+            machine_types = {tag.cell_type for ent, (factory, inv, tag) in factories}
+            self._needed_resources = frozenset().union(
+                *(
+                    MACHINE_INPUTS.get(machine_type, ())
+                    for machine_type in machine_types
+                )
+            )
+        return self._needed_resources
+
+    def _find_target(self, pos, drone):
+        # Machines that consume something the drone carries
+        consumers = frozenset().union(
+            *(ITEM_CONSUMERS.get(item, ()) for item in drone.inventory)
+        )
 
         # 1. Check Factories that need inputs
-        for ent, (factory, inv, factory_pos, tag) in esper.get_components(
-            Factory, Inventory, Position, MapTag
-        ):
-            # Check if factory accepts what drone has
-            if not drone.inventory:
-                continue
+        def accepts_item(ent):
+            inv = esper.try_component(ent, Inventory)
+            tag = esper.try_component(ent, MapTag)
+            if inv is None or tag is None:
+                return False
 
-            # Get machine type and valid inputs
-            machine_type = tag.cell_type
+            if tag.cell_type not in consumers:
+                return False
 
             # Simple check: does any recipe for this machine use the item?
-            accepts_item = False
-
-            for recipe_name, data in RECIPES.items():
-                if data["machine"] == machine_type:
-                    for input_item, input_amount in data["inputs"].items():
-                        if input_item in drone.inventory:
-                            # Check input limit (e.g., 5x recipe cost)
-                            current_amount = inv.resources.get(input_item, 0)
-                            if current_amount < input_amount * 5:
-                                accepts_item = True
-                            break
-                if accepts_item:
-                    break
-
-            if accepts_item:
-                dist = math.hypot(factory_pos.x - pos.x, factory_pos.y - pos.y)
-                if dist < min_dist:
-                    min_dist = dist
-                    best_id = ent
-
-        if best_id != -1:
-            return best_id
+            for recipe_name in MACHINE_RECIPES[tag.cell_type]:
+                for input_item, input_amount in RECIPES[recipe_name]["inputs"].items():
+                    if input_item in drone.inventory:
+                        # Check input limit (e.g., 5x recipe cost)
+                        current_amount = inv.resources.get(input_item, 0)
+                        if current_amount < input_amount * 5:
+                            return True
+                        break
+            return False
+
+        if consumers:
+            factory = self.spatial.factories.nearest(
+                pos.x, pos.y, predicate=accepts_item
+            )
+            if factory is not None:
+                return factory.entity_id
 
         # 2. Check Storage
-        for ent, (store, inv, store_pos) in esper.get_components(
-            Storage, Inventory, Position
-        ):
+        def has_space(ent):
             # Don't return the same storage we just took from
             if ent == drone.source_id:
-                continue
+                return False
+
+            store = esper.try_component(ent, Storage)
+            inv = esper.try_component(ent, Inventory)
+            if store is None or inv is None:
+                return False
 
             # Check if storage has space
             total_items = sum(inv.resources.values())
-            if total_items >= store.capacity:
-                continue
+            return total_items < store.capacity
 
-            dist = math.hypot(store_pos.x - pos.x, store_pos.y - pos.y)
-            if dist < min_dist:
-                min_dist = dist
-                best_id = ent
+        storage = self.spatial.storages.nearest(pos.x, pos.y, predicate=has_space)
+        if storage is not None:
+            return storage.entity_id
 
-        return best_id
+        return -1
 
     @staticmethod
     def _take_items(drone, source_id):
@@ -404,15 +516,10 @@ class LogisticsProcessor(esper.Processor):
             source_id, MapTag
         ):
             tag = esper.component_for_entity(source_id, MapTag)
-            machine_type = tag.cell_type
-            valid_inputs = set()
-            for recipe_name, data in RECIPES.items():
-                if data["machine"] == machine_type:
-                    for input_item in data["inputs"]:
-                        valid_inputs.add(input_item)
+            outputs = MACHINE_OUTPUTS.get(tag.cell_type, frozenset())
 
             for res, amount in list(inv.resources.items()):
-                if res not in valid_inputs:
+                if res in outputs:
                     to_take = min(amount, drone.capacity)
                     remove_resources(inv, {res: to_take})
                     drone.inventory[res] = drone.inventory.get(res, 0) + to_take
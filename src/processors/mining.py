@@ -5,26 +5,21 @@ import math
 from src.components.gameplay import Inventory, ResourceSource, PlayerControl
 from src.components.logistics import ResourceChunk
 from src.components.physics import Velocity, Position
-from src.components.render import Renderable
+from src.components.render import Instance, Renderable
+from src.game_data import RESOURCE_COLOR_INDEX
 from src.systems.inventory import add_item
 from src.systems.audio import AudioSystem
 from src.processors.mouse import MouseProcessor
+from src.rendering import BeamBatch, ParticlePool
+from src.rendering.beams import DrawPositionFn
+from src.rendering.lod import LOD_FULL, lod_for_zoom
+from src.systems.spatial_index import SpatialIndexService
 
 MINING_AMOUNT = 1
 MINING_RATE = 0.2
 LASER_COLOR = (100, 255, 255, 200)
-
-
-class Particle:
-    def __init__(self, x, y, dx, dy, color, life):
-        self.x = x
-        self.y = y
-        self.dx = dx
-        self.dy = dy
-        self.color = color
-        self.life = life
-        self.max_life = life
-        self.time = 0
+LASER_CORE_COLOR = (255, 255, 255, 180)
+PARTICLE_SIZE = 4
 
 
 class MiningProcessor(esper.Processor):
@@ -32,65 +27,58 @@ class MiningProcessor(esper.Processor):
         self,
         camera: arcade.Camera2D,
         mouse: MouseProcessor,
-        chunk_list: arcade.SpriteList,
+        spatial: SpatialIndexService,
     ):
         super().__init__()
         self.time = 0.0
         self.camera = camera
         self.mouse = mouse
-        self.chunk_list = chunk_list
+        self.spatial = spatial
 
         self.mining_timer = 0.0
 
         self.is_mining_active = False
-        self.laser_start = (0.0, 0.0)
+        # The laser runs from this entity, the mining ship
+        self.laser_source = -1
         self.laser_end = (0.0, 0.0)
 
-        self.particles: list[Particle] = []
+        self.particles = ParticlePool()
 
     def process(self, dt: float):
         self.time += dt % math.pi
         self.is_mining_active = False
-        self._update_particles(dt)
+        self.particles.update(dt)
 
         if not self.mouse.is_pressed(arcade.MOUSE_BUTTON_RIGHT):
             self.mining_timer = 0
             return
 
-        world_x, world_y, world_z = self.camera.unproject((self.mouse.x, self.mouse.y))
+        world_x = self.mouse.frame.world_x
+        world_y = self.mouse.frame.world_y
 
-        target_entity = None
-        target_pos = None
-
-        for ent, (res_source, renderable, pos) in esper.get_components(
-            ResourceSource, Renderable, Position
-        ):
-            if res_source.amount > 0 and renderable.sprite.collides_with_point(
-                (world_x, world_y)
-            ):
-                target_entity = ent
-                target_pos = (pos.x, pos.y)
-                break
-
-        if target_entity is None or target_pos is None:
+        target_entity = self.spatial.pick_asteroid(world_x, world_y)
+        if target_entity is None:
             return
 
+        pos = esper.component_for_entity(target_entity, Position)
+        target_pos = (pos.x, pos.y)
+
         self.mouse.mark_handled()
 
         player_inventory = None
-        player_pos = None
+        player_ent = None
         for ent, (inv, ctrl, pos) in esper.get_components(
             Inventory, PlayerControl, Position
         ):
             player_inventory = inv
-            player_pos = (pos.x, pos.y)
+            player_ent = ent
             break
 
-        if player_inventory is None or player_pos is None:
+        if player_inventory is None or player_ent is None:
             return
 
         self.is_mining_active = True
-        self.laser_start = player_pos
+        self.laser_source = player_ent
         self.laser_end = (
             world_x,
             world_y,
@@ -114,7 +102,7 @@ class MiningProcessor(esper.Processor):
 
         AudioSystem().play_sound("laser")
 
-        self._spawn_particles(
+        self.spawn_particles(
             self.laser_end[0], self.laser_end[1], res_source.resource_type
         )
 
@@ -133,8 +121,9 @@ class MiningProcessor(esper.Processor):
             if renderable:
                 renderable.sprite.remove_from_sprite_lists()
             esper.delete_entity(entity_id)
+            self.spatial.asteroids.remove(entity_id)
 
-    def _spawn_particles(self, x, y, res_type):
+    def spawn_particles(self, x, y, res_type, count=3):
         color = arcade.color.WHITE
         if res_type == "gold":
             color = arcade.color.GOLD
@@ -143,27 +132,9 @@ class MiningProcessor(esper.Processor):
         elif res_type == "silicon":
             color = arcade.color.BLUE_GRAY
 
-        for _ in range(3):
-            angle = random.uniform(0, 6.28)
-            speed = random.uniform(30, 100)
-            dx = math.cos(angle) * speed
-            dy = math.sin(angle) * speed
-            life = random.uniform(0.3, 0.6)
-            self.particles.append(Particle(x, y, dx, dy, color, life))
+        self.particles.emit(x, y, color, count)
 
     def spawn_chunk(self, x, y, res_type, amount):
-        sprite = arcade.SpriteCircle(3, arcade.color.YELLOW)  # Placeholder color
-        if res_type == "iron":
-            sprite.color = arcade.color.GRAY
-        elif res_type == "gold":
-            sprite.color = arcade.color.GOLD
-        elif res_type == "silicon":
-            sprite.color = arcade.color.BLUE_GRAY
-
-        sprite.center_x = x
-        sprite.center_y = y
-        self.chunk_list.append(sprite)
-
         angle = random.uniform(0, 6.28)
         speed = random.uniform(20, 50)
         dx = math.cos(angle) * speed
@@ -172,51 +143,27 @@ class MiningProcessor(esper.Processor):
         esper.create_entity(
             Position(x, y),
             Velocity(dx, dy),
-            Renderable(sprite=sprite),
+            Instance("chunks", color=RESOURCE_COLOR_INDEX.get(res_type, 0)),
             ResourceChunk(resource_type=res_type, amount=amount),
         )
 
-    def _update_particles(self, dt):
-        for p in self.particles:
-            p.life -= dt
-            p.x += p.dx * dt
-            p.y += p.dy * dt
+    def add_beams(self, beams: BeamBatch, draw_position: DrawPositionFn):
+        """Add the laser while mining, from where the ship is drawn."""
+        if not self.is_mining_active:
+            return
 
-            p.dx *= 0.9
-            p.dy *= 0.9
+        start = draw_position(self.laser_source)
+        if start is None:
+            return
 
-        self.particles = [p for p in self.particles if p.life > 0]
+        time_sin = math.sin(self.time * 4)
+        x1, y1 = start
+        x2, y2 = self.laser_end
 
-    def on_draw(self):
-        if self.is_mining_active:
-            time_sin = math.sin(self.time * 4)
-
-            arcade.draw_line(
-                self.laser_start[0],
-                self.laser_start[1],
-                self.laser_end[0],
-                self.laser_end[1],
-                LASER_COLOR,
-                3 + time_sin,
-            )
+        beams.add(x1, y1, x2, y2, LASER_COLOR, 3 + time_sin)
+        beams.add(x1, y1, x2, y2, LASER_CORE_COLOR, 1 + time_sin)
 
-            arcade.draw_line(
-                self.laser_start[0],
-                self.laser_start[1],
-                self.laser_end[0],
-                self.laser_end[1],
-                (255, 255, 255, 180),
-                1 + time_sin,
-            )
-
-        for p in self.particles:
-            alpha = int(255 * (p.life / p.max_life))
-            # Arcade colors are (r, g, b) or (r, g, b, a).
-            # If color is 3-tuple, add alpha. If 4, replace alpha.
-            c = p.color
-            if len(c) == 3:
-                draw_color = c + (alpha,)
-            else:
-                draw_color = (c[0], c[1], c[2], alpha)
-
-            arcade.draw_point(p.x, p.y, draw_color, 4)
+    def on_draw(self):
+        # Particles are under 2 px wide below full detail
+        if lod_for_zoom(self.camera.zoom) == LOD_FULL:
+            self.particles.draw(PARTICLE_SIZE * self.camera.zoom)
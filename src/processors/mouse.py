@@ -1,6 +1,24 @@
+from dataclasses import dataclass, field
+
+import arcade
 import esper
 
 
+@dataclass
+class InputFrame:
+    """Cursor and camera state, computed once by CameraProcessor and read by
+    every processor that needs the cursor in world or grid coordinates."""
+
+    screen_x: float = 0.0
+    screen_y: float = 0.0
+    world_x: float = 0.0
+    world_y: float = 0.0
+    grid_x: int = 0
+    grid_y: int = 0
+    # Visible world rectangle
+    view: arcade.types.Rect = field(default_factory=lambda: arcade.LRBT(0, 0, 0, 0))
+
+
 class MouseProcessor(esper.Processor):
     def __init__(self) -> None:
         super().__init__()
@@ -12,6 +30,9 @@ class MouseProcessor(esper.Processor):
         self.buttons_pressed: set[int] = set()
         self.handled: bool = False
 
+        # Updated in place by CameraProcessor.update_input_frame()
+        self.frame = InputFrame()
+
     def process(self, dt: float):
         self.scroll_x = 0
         self.scroll_y = 0
@@ -1,40 +1,50 @@
 import esper
-from src.components.physics import Position, Velocity
-from src.components.gameplay import ResourceSource
+import numpy as np
+
+from src.components.physics import Sleeping
 from src.components.render import Renderable
-from src.game_data import MAP_LIMIT_X, MAP_LIMIT_Y
+from src.systems.physics_store import CULLED, LIMITS_X, LIMITS_Y, PhysicsStore
 
 
 class MovementProcessor(esper.Processor):
     def __init__(self):
         super().__init__()
         self.entities_to_delete = []
+        self.store = PhysicsStore()
+
+        # Profiling counters, refreshed every process() call
+        self.awake_count = 0
+        self.sleeping_count = 0
 
     def process(self, dt: float) -> None:
         self.entities_to_delete.clear()
 
-        for ent, (pos, vel) in esper.get_components(Position, Velocity):
-            pos.x += vel.dx * dt
-            pos.y += vel.dy * dt
-
-            limit_x: float = MAP_LIMIT_X
-            limit_y: float = MAP_LIMIT_Y
-
-            if esper.has_component(ent, ResourceSource):
-                limit_x *= 1.5
-                limit_y *= 1.5
-                if abs(pos.x) > limit_x or abs(pos.y) > limit_y:
-                    self.entities_to_delete.append(ent)
-                    continue
-
-            if pos.x < -limit_x:
-                pos.x = -limit_x
-            if pos.x > limit_x:
-                pos.x = limit_x
-            if pos.y < -limit_y:
-                pos.y = -limit_y
-            if pos.y > limit_y:
-                pos.y = limit_y
+        store = self.store
+        store.sync()
+        n = store.count
+
+        self.awake_count = n
+        self.sleeping_count = len(esper.get_component(Sleeping))
+
+        x = store.x[:n]
+        y = store.y[:n]
+        x += store.dx[:n] * dt
+        y += store.dy[:n] * dt
+
+        limit_class = store.limit_class[:n]
+        limit_x = LIMITS_X[limit_class]
+        limit_y = LIMITS_Y[limit_class]
+
+        out_of_bounds = CULLED[limit_class] & (
+            (np.abs(x) > limit_x) | (np.abs(y) > limit_y)
+        )
+        # Culled bodies keep their last position until they are deleted
+        keep = ~out_of_bounds
+        np.clip(x, -limit_x, limit_x, out=x, where=keep)
+        np.clip(y, -limit_y, limit_y, out=y, where=keep)
+
+        for slot in np.flatnonzero(out_of_bounds):
+            self.entities_to_delete.append(store.entities[slot])
 
         for ent in self.entities_to_delete:
             if esper.entity_exists(ent):
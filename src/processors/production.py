@@ -1,7 +1,8 @@
 import esper
 from src.components.production import Factory
 from src.components.gameplay import Inventory
-from src.game_data import RECIPES
+from src.components.map import MapTag
+from src.game_data import MACHINE_RECIPES, RECIPES
 from src.systems.inventory import remove_resources, add_item
 
 
@@ -10,19 +11,21 @@ class ProductionProcessor(esper.Processor):
         super().__init__()
 
     def process(self, dt: float):
-        for ent, (factory, inv) in esper.get_components(Factory, Inventory):
+        for ent, (factory, inv, tag) in esper.get_components(
+            Factory, Inventory, MapTag
+        ):
             if not factory.is_working:
-                self._check_start_production(factory, inv)
+                self._check_start_production(factory, inv, tag.cell_type)
             else:
                 self._process_production(dt, factory, inv)
 
-    def _check_start_production(self, factory: Factory, inv: Inventory):
+    def _check_start_production(self, factory: Factory, inv: Inventory, machine: int):
         possible_recipe = None
-        for name, data in RECIPES.items():
+        for name in MACHINE_RECIPES.get(machine, ()):
             # Check if inputs match what's in inventory
-            inputs = data["inputs"]
+            inputs = RECIPES[name]["inputs"]
             has_inputs = True
-            for res, amount in inputs.items():  # type: ignore
+            for res, amount in inputs.items():
                 if inv.resources.get(res, 0) < amount:
                     has_inputs = False
                     break
@@ -33,12 +36,12 @@ class ProductionProcessor(esper.Processor):
 
         if possible_recipe:
             factory.recipe_id = possible_recipe
-            factory.processing_time = RECIPES[possible_recipe]["time"]  # type: ignore
+            factory.processing_time = RECIPES[possible_recipe]["time"]
             factory.progress = 0.0
             factory.is_working = True
 
             inputs = RECIPES[possible_recipe]["inputs"]
-            remove_resources(inv, inputs)  # type: ignore
+            remove_resources(inv, inputs)
 
     def _process_production(self, dt: float, factory: Factory, inv: Inventory):
         factory.progress += dt
@@ -47,7 +50,7 @@ class ProductionProcessor(esper.Processor):
             recipe = RECIPES.get(factory.recipe_id)
             if recipe:
                 outputs = recipe["outputs"]
-                for res, amount in outputs.items():  # type: ignore
+                for res, amount in outputs.items():
                     add_item(inv, res, amount)
 
             factory.is_working = False
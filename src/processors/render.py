@@ -1,62 +1,358 @@
 import arcade
 import esper
+import numpy as np
 
-from src.components.physics import Position
-from src.components.render import Renderable
-from src.sprites import SpriteListType
+from src.components.logistics import Drone
+from src.components.physics import Position, Sleeping, Velocity
+from src.components.render import Instance, Renderable
+from src.game_data import BACKGROUND_SCALE, BACKGROUND_UPDATE_RATE, RESOURCE_COLORS
+from src.processors.builder import ACTUAL_TILE_SIZE, CHUNK_TILES
+from src.processors.mouse import InputFrame
+from src.rendering import (
+    BeamBatch,
+    ChunkedSpriteLayer,
+    FloorChunkRenderer,
+    InstanceBatch,
+    Starfield,
+)
+from src.rendering.beams import BeamSource
+from src.rendering.lod import FLOOR_DETAIL, HIDDEN_LAYERS, LOD_FULL, lod_for_zoom
+from src.sprites import SpriteListType, SpritePool, create_circle_sprite
+from src.systems.physics_store import PhysicsStore
 
 
 class RenderProcessor(esper.Processor):
     def __init__(
-        self, window: arcade.Window, camera: arcade.Camera2D, ui_camera: arcade.Camera2D
+        self,
+        window: arcade.Window,
+        camera: arcade.Camera2D,
+        ui_camera: arcade.Camera2D,
+        physics: PhysicsStore,
+        input_frame: InputFrame,
+        background_scale: float = BACKGROUND_SCALE,
+        background_update_rate: float | None = BACKGROUND_UPDATE_RATE,
     ) -> None:
         super().__init__()
 
         self.window = window
         self.camera = camera
         self.ui_camera = ui_camera
+        self.physics = physics
+        # Its view is the visible world rectangle of the camera
+        self.input_frame = input_frame
 
-        self.quad_fs = arcade.gl.geometry.quad_2d_fs()
-        self.program = window.ctx.load_program(
-            fragment_shader="shaders/stars.frag",
-            vertex_shader="shaders/default_vs.glsl",
+        # How far the displayed frame is between the last two simulation
+        # steps, set by GameView before every process() call.
+        self.alpha = 1.0
+        self.previous_positions: dict[int, tuple[Position, float, float]] = {}
+
+        # Sprites of physics bodies, followed as bodies are bound and released
+        # and only written when their position changes. Everything else
+        # (buildings) is placed by its creator and costs nothing per frame.
+        self._sprites: dict[int, arcade.Sprite] = {}
+        # Physics store slots of the entities in _sprites
+        self._sprite_slots = np.empty(0, dtype=np.intp)
+        self._physics_version = -1
+
+        self.starfield = Starfield(
+            window.ctx,
+            window.get_framebuffer_size(),
+            scale=background_scale,
+            update_rate=background_update_rate,
         )
-        self.program["u_resolution"] = (window.width, window.height)
         self.total_time = 0.0
 
+        # Level of detail of the last on_draw(), from the camera zoom. The
+        # floor renderer is created by BuilderProcessor and set by GameView.
+        self.lod = LOD_FULL
+        self.floor_renderer: FloorChunkRenderer | None = None
+
+        # Stats of the last on_draw() for the chunked layers
+        self.chunks_drawn = 0
+        self.chunks_skipped = 0
+
+        # Built floor and objects, drawn first and culled by world chunk
+        chunk_size = CHUNK_TILES * ACTUAL_TILE_SIZE
+        self.floor_layer = ChunkedSpriteLayer(chunk_size, margin=ACTUAL_TILE_SIZE)
+        self.object_layer = ChunkedSpriteLayer(chunk_size, margin=ACTUAL_TILE_SIZE)
+
         self.sprite_lists: dict[str, SpriteListType] = {
-            "floor": arcade.SpriteList(),
-            "objects": arcade.SpriteList(),
             "asteroids": arcade.SpriteList(),
             "entities": arcade.SpriteList(),
             "projectiles": arcade.SpriteList(),
-            "chunks": arcade.SpriteList(),
-            "drones": arcade.SpriteList(),
+        }
+
+        # The most numerous entities are drawn without sprites, drawn after
+        # the sprite lists in this order
+        self.instance_batches: dict[str, InstanceBatch] = {
+            "chunks": InstanceBatch(3, RESOURCE_COLORS),
+            "drones": InstanceBatch(5, [arcade.color.WHITE]),
+        }
+
+        # Each Instance has a row of its batch from when it appears until it
+        # goes, see _track_instances(). Rows that follow a physics body are
+        # filled from the store in one array copy per frame, the rows of
+        # movers one by one, and the others (sleeping chunks) stay put.
+        self._instances: list | None = None
+        self._instance_rows: dict[int, tuple[str, int, Position]] = {}
+        self._row_entities: dict[str, np.ndarray] = {}
+        self._instance_bodies: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._instance_movers: dict[str, dict[int, tuple[int, Position, Instance]]] = {}
+        self._clear_instances()
+
+        # Laser beams, turret tracers and such, drawn last. The batch is rebuilt
+        # every frame from the sources, so segments end where the sprites
+        # they join are drawn.
+        self.beams = BeamBatch()
+        self.beam_sources: list[BeamSource] = []
+
+        # Short-lived sprites are recycled rather than removed from their
+        # lists; see SpritePool.
+        self.sprite_pools: dict[str, SpritePool] = {
+            "projectiles": SpritePool(
+                self.sprite_lists["projectiles"],
+                lambda: create_circle_sprite(5, arcade.color.WHITE),
+                reserve=64,
+            ),
+        }
+
+    def save_previous(self) -> None:
+        """Remember positions at the start of a simulation step."""
+        self.physics.save_previous()
+
+        # Drones are moved directly by LogisticsProcessor, without a Velocity,
+        # so they are not in the physics store.
+        self.previous_positions = {
+            ent: (pos, pos.x, pos.y)
+            for ent, (drone, pos) in esper.get_components(Drone, Position)
         }
 
     def process(self, dt: float) -> None:
-        for ent, (renderable, pos) in esper.get_components(Renderable, Position):
-            renderable.sprite.position = pos.x, pos.y
+        # A single component query: cheaper for esper to rebuild, and only
+        # new entities need their Position
+        instances = esper.get_component(Instance)
+        changed = self.physics.version != self._physics_version
+
+        self._track_sprites(*self.physics.take_changes())
+
+        if instances is not self._instances:
+            self._instances = instances
+            changed |= self._track_instances(instances)
+
+        if changed:
+            self._physics_version = self.physics.version
+            self._map_bodies()
+
+        alpha = self.alpha
+        sprites = self._sprites
+        entities = self.physics.entities
+
+        for slot, x, y in zip(
+            *self.physics.take_draw_updates(alpha, self._sprite_slots)
+        ):
+            sprites[entities[slot]].position = x, y
+
+        self._update_instances(alpha)
+
+        self.beams.clear()
+        for add_beams in self.beam_sources:
+            add_beams(self.beams, self.draw_position)
 
         self.total_time += dt
 
+    def draw_position(self, ent: int) -> tuple[float, float] | None:
+        """Where ``ent`` is drawn this frame, interpolated as its sprite or
+        instance is, or None if it no longer exists."""
+        if not esper.entity_exists(ent):
+            return None
+
+        alpha = self.alpha
+        physics = self.physics
+        slot = physics.slots.get(ent)
+        if slot is not None:
+            px = float(physics.prev_x[slot])
+            py = float(physics.prev_y[slot])
+            return (
+                px + (float(physics.x[slot]) - px) * alpha,
+                py + (float(physics.y[slot]) - py) * alpha,
+            )
+
+        previous = self.previous_positions.get(ent)
+        if previous is not None:
+            pos, px, py = previous
+            return px + (pos.x - px) * alpha, py + (pos.y - py) * alpha
+
+        current = esper.try_component(ent, Position)
+        if current is None:
+            return None
+        return current.x, current.y
+
+    def _track_sprites(self, released: list[int], bound: list[int]) -> None:
+        """Follow the sprites of newly bound bodies, forget released ones."""
+        sprites = self._sprites
+        for ent in released:
+            sprites.pop(ent, None)
+
+        slots = self.physics.slots
+        for ent in bound:
+            if ent not in slots or not esper.entity_exists(ent):
+                continue  # Released or deleted since
+            renderable = esper.try_component(ent, Renderable)
+            if renderable is not None:
+                sprites[ent] = renderable.sprite
+
+    def _clear_instances(self) -> None:
+        self._instances = None
+        self._instance_rows.clear()
+
+        for name, batch in self.instance_batches.items():
+            batch.clear()
+            self._row_entities[name] = np.full(len(batch.data), -1, dtype=np.intp)
+            self._instance_bodies[name] = (
+                np.empty(0, dtype=np.intp),
+                np.empty(0, dtype=np.intp),
+            )
+            self._instance_movers[name] = {}
+
+    def _track_instances(self, instances) -> bool:
+        """Give a row to each instance that came and take back those of the
+        instances that went.
+
+        New rows are written in full. Instances moved outside the physics
+        store (drones) are recorded as movers. Returns whether there were
+        any.
+        """
+        current = dict(instances)
+        rows = self._instance_rows
+        gone = rows.keys() - current.keys()
+        new = current.keys() - rows.keys()
+
+        for ent in gone:
+            name, row, _ = rows.pop(ent)
+            self.instance_batches[name].remove(row)
+            self._row_entities[name][row] = -1
+            self._instance_movers[name].pop(ent, None)
+
+        for ent in new:
+            instance = current[ent]
+            pos = esper.component_for_entity(ent, Position)
+            name = instance.batch
+            batch = self.instance_batches[name]
+            row = batch.add()
+            batch.data[row] = pos.x, pos.y, instance.angle, instance.color
+
+            entities = self._row_entities[name]
+            if row >= len(entities):
+                entities = np.resize(entities, len(batch.data))
+                entities[row:] = -1
+                self._row_entities[name] = entities
+            entities[row] = ent
+
+            rows[ent] = name, row, pos
+            body = esper.has_component(ent, Velocity)
+            if not body and not esper.has_component(ent, Sleeping):
+                self._instance_movers[name][ent] = row, pos, instance
+
+        return bool(gone or new)
+
+    def _map_bodies(self) -> None:
+        """Find the sprites and instance rows that follow a physics body.
+
+        An instance that stopped following one was put to sleep, its
+        Velocity taken away; its row is written once here where the body
+        last was.
+        """
+        # Only sprites of bodies are tracked, so every one has a slot
+        self._sprite_slots = np.fromiter(
+            map(self.physics.slots.__getitem__, self._sprites),
+            np.intp,
+            len(self._sprites),
+        )
+
+        for name, batch in self.instance_batches.items():
+            entities = self._row_entities[name][: batch.count]
+            slots = self.physics.slots_of(entities)
+            body_rows = np.flatnonzero(slots >= 0)
+
+            old_rows, _ = self._instance_bodies[name]
+            for row in np.setdiff1d(old_rows, body_rows).tolist():
+                ent = int(entities[row])
+                if ent != -1:
+                    _, _, pos = self._instance_rows[ent]
+                    batch.data[row, :2] = pos.x, pos.y
+
+            self._instance_bodies[name] = body_rows, slots[body_rows]
+
+    def _update_instances(self, alpha: float) -> None:
+        xs, ys = self.physics.interpolate(alpha)
+
+        for name, batch in self.instance_batches.items():
+            rows, slots = self._instance_bodies[name]
+            batch.x[rows] = xs[slots]
+            batch.y[rows] = ys[slots]
+
+            x = batch.x
+            y = batch.y
+            angle = batch.angle
+            for ent, (row, pos, instance) in self._instance_movers[name].items():
+                previous = self.previous_positions.get(ent)
+                if previous is None:
+                    x[row] = pos.x
+                    y[row] = pos.y
+                else:
+                    _, px, py = previous
+                    x[row] = px + (pos.x - px) * alpha
+                    y[row] = py + (pos.y - py) * alpha
+                angle[row] = instance.angle
+
     def on_draw(self) -> None:
         self.window.clear()
 
         self.camera.use()
 
-        self.program["u_time"] = self.total_time
-        self.quad_fs.render(self.program)
+        self.starfield.draw(self.total_time)
+
+        self.lod = lod_for_zoom(self.camera.zoom)
+        if self.floor_renderer is not None:
+            self.floor_renderer.set_detail(FLOOR_DETAIL[self.lod])
+        hidden = HIDDEN_LAYERS[self.lod]
 
-        for sprite_list in self.sprite_lists.values():
-            sprite_list.draw(pixelated=True)
+        view = self.input_frame.view
+        self.chunks_drawn = 0
+        self.chunks_skipped = 0
+
+        for layer in (self.floor_layer, self.object_layer):
+            layer.draw(view, pixelated=True)
+            self.chunks_drawn += layer.chunks_drawn
+            self.chunks_skipped += layer.chunks_skipped
+
+        for name, sprite_list in self.sprite_lists.items():
+            if name not in hidden:
+                sprite_list.draw(pixelated=True)
+
+        for name, batch in self.instance_batches.items():
+            if name not in hidden:
+                batch.draw()
+
+        self.beams.draw()
 
     def on_resize(self, width: int, height: int) -> None:
-        self.program["u_resolution"] = (width, height)
+        self.starfield.resize(*self.window.get_framebuffer_size())
 
         self.camera.match_window()
         self.ui_camera.match_window()
 
     def clear_all_sprites(self):
-        for sl in self.sprite_lists.values():
-            sl.clear()
+        self.floor_layer.clear()
+        self.object_layer.clear()
+
+        for name, sl in self.sprite_lists.items():
+            if name in self.sprite_pools:
+                self.sprite_pools[name].reset()
+            else:
+                sl.clear()
+
+        self._clear_instances()
+        self._sprites = {}
+        self._physics_version = -1
+        self.beams.clear()
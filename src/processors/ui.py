@@ -1,18 +1,22 @@
 import arcade
 import esper
+import pyglet
+from arcade.shape_list import ShapeElementList, create_rectangle_outline
 
-from src.components.gameplay import Inventory, PlayerControl
+from src.components.gameplay import Inventory, PlayerControl, ResourceSource
 from src.components.map import MapTag
 from src.components.logistics import Storage
 from src.processors import KeyboardProcessor
 from src.processors.mouse import MouseProcessor
 from src.processors.builder import BuilderProcessor
+from src.systems.spatial_index import SpatialIndexService
 from src.game_data import (
     TOOLBAR_ITEMS,
     TOOLBAR_SLOT_SIZE,
     TOOLBAR_PADDING,
     TOOLBAR_SELECTED_COLOR,
     BLOCK_PROPERTIES,
+    MACHINE_RECIPES,
     RECIPES,
 )
 from src.components.production import Factory
@@ -25,12 +29,25 @@ class UIProcessor(esper.Processor):
         mouse: MouseProcessor,
         keyboard: KeyboardProcessor,
         builder: BuilderProcessor,
+        spatial: SpatialIndexService,
     ):
         super().__init__()
         self.window = window
         self.mouse = mouse
         self.keyboard = keyboard
         self.builder = builder
+        self.spatial = spatial
+
+        # The HUD is retained: text is laid out again only when its string
+        # changes, and the toolbar is rebuilt only when the window width or
+        # the selected block changes.
+        self.inventory_text = arcade.Text("", 10, 0, arcade.color.WHITE, 14)
+        self.tooltip_lines: list[arcade.Text] = []
+
+        self.toolbar_shapes: ShapeElementList = ShapeElementList()
+        self.toolbar_batch = pyglet.graphics.Batch()
+        self.toolbar_labels: list[arcade.Text] = []
+        self._toolbar_state: tuple[int, int] | None = None
 
     def process(self, dt: float):
         for i in range(10):
@@ -79,25 +96,12 @@ class UIProcessor(esper.Processor):
         self._draw_hover_info()
 
     def _draw_hover_info(self):
-        # Convert mouse to world
-        world_x, world_y, _ = self.builder.camera.unproject(
-            (self.mouse.x, self.mouse.y)
-        )
-
-        # Grid coords
-        from src.processors.builder import ACTUAL_TILE_SIZE
-
-        gx = int(world_x // ACTUAL_TILE_SIZE)
-        gy = int(world_y // ACTUAL_TILE_SIZE)
-
-        # Find entity at this location
-        world_map = self.builder.get_world_map()
-        if not world_map:
-            return
+        frame = self.mouse.frame
 
-        ent_id = world_map.entity_map.get((gx, gy, 1))  # Check object layer
-        if not ent_id:
-            ent_id = world_map.entity_map.get((gx, gy, 0))  # Check floor layer
+        # Asteroids are drawn above blocks
+        ent_id = self.spatial.pick_asteroid(frame.world_x, frame.world_y)
+        if ent_id is None:
+            ent_id = self._block_at(frame.grid_x, frame.grid_y)
 
         if not ent_id or not esper.entity_exists(ent_id):
             return
@@ -105,6 +109,11 @@ class UIProcessor(esper.Processor):
         # Gather info
         info_lines = []
 
+        if esper.has_component(ent_id, ResourceSource):
+            res_source = esper.component_for_entity(ent_id, ResourceSource)
+            info_lines.append(f"Asteroid: {res_source.resource_type}")
+            info_lines.append(f"Resources: {res_source.amount}/{res_source.max_amount}")
+
         # Name
         if esper.has_component(ent_id, MapTag):
             tag = esper.component_for_entity(ent_id, MapTag)
@@ -141,25 +150,24 @@ class UIProcessor(esper.Processor):
                     machine_type = tag.cell_type
 
                     # Check recipes
-                    for name, data in RECIPES.items():
-                        if data["machine"] == machine_type:
-                            # Check inputs
-                            missing = []
-                            inv = esper.component_for_entity(ent_id, Inventory)
-                            for res, amount in data["inputs"].items():
-                                current = inv.resources.get(res, 0)
-                                if current < amount:
-                                    missing.append(f"{res} ({current}/{amount})")
-
-                            if missing:
-                                info_lines.append(f"Missing: {', '.join(missing)}")
+                    for name in MACHINE_RECIPES.get(machine_type, ()):
+                        # Check inputs
+                        missing = []
+                        inv = esper.component_for_entity(ent_id, Inventory)
+                        for res, amount in RECIPES[name]["inputs"].items():
+                            current = inv.resources.get(res, 0)
+                            if current < amount:
+                                missing.append(f"{res} ({current}/{amount})")
+
+                        if missing:
+                            info_lines.append(f"Missing: {', '.join(missing)}")
 
         if not info_lines:
             return
 
         # Draw tooltip
-        x = self.mouse.x + 15
-        y = self.mouse.y - 15
+        x = frame.screen_x + 15
+        y = frame.screen_y - 15
 
         line_height = 16
         padding = 5
@@ -173,14 +181,25 @@ class UIProcessor(esper.Processor):
         )
 
         # Text
+        while len(self.tooltip_lines) < len(info_lines):
+            self.tooltip_lines.append(arcade.Text("", 0, 0, arcade.color.WHITE, 12))
+
         for i, line in enumerate(info_lines):
-            arcade.draw_text(
-                line,
-                x + padding,
-                y - padding - (i + 1) * line_height + 4,
-                arcade.color.WHITE,
-                12,
-            )
+            text = self.tooltip_lines[i]
+            text.text = line
+            text.position = x + padding, y - padding - (i + 1) * line_height + 4
+            text.draw()
+
+    def _block_at(self, gx: int, gy: int) -> int | None:
+        # Find entity at this location
+        world_map = self.builder.get_world_map()
+        if not world_map:
+            return None
+
+        ent_id = world_map.entity_map.get((gx, gy, 1))  # Check object layer
+        if not ent_id:
+            ent_id = world_map.entity_map.get((gx, gy, 0))  # Check floor layer
+        return ent_id
 
     def _draw_inventory_text(self):
         player_inv = None
@@ -192,9 +211,20 @@ class UIProcessor(esper.Processor):
             text = ""
             for resource, amount in player_inv.resources.items():
                 text += f"{resource}: {amount} | "
-            arcade.draw_text(text, 10, self.window.height - 30, arcade.color.WHITE, 14)
+            self.inventory_text.text = text
+            self.inventory_text.y = self.window.height - 30
+            self.inventory_text.draw()
 
     def _draw_toolbar(self):
+        state = (self.window.width, self.builder.selected_block)
+        if state != self._toolbar_state:
+            self._toolbar_state = state
+            self._build_toolbar()
+
+        self.toolbar_shapes.draw()
+        self.toolbar_batch.draw()
+
+    def _build_toolbar(self):
         screen_w = self.window.width
         num_items = len(TOOLBAR_ITEMS)
 
@@ -203,6 +233,10 @@ class UIProcessor(esper.Processor):
         )
         start_x = (screen_w - total_width) // 2
 
+        self.toolbar_shapes = ShapeElementList()
+        self.toolbar_batch = pyglet.graphics.Batch()
+        self.toolbar_labels = []
+
         for i, block_type in enumerate(TOOLBAR_ITEMS):
             x = start_x + TOOLBAR_PADDING + i * (TOOLBAR_SLOT_SIZE + TOOLBAR_PADDING)
             y = TOOLBAR_PADDING
@@ -210,22 +244,39 @@ class UIProcessor(esper.Processor):
             is_selected = self.builder.selected_block == block_type
             color = TOOLBAR_SELECTED_COLOR if is_selected else (100, 100, 100, 255)
 
-            arcade.draw_rect_outline(
-                arcade.rect.XYWH(x, y, TOOLBAR_SLOT_SIZE, TOOLBAR_SLOT_SIZE),
-                color=color,
-                border_width=2 if is_selected else 1,
+            self.toolbar_shapes.append(
+                create_rectangle_outline(
+                    x,
+                    y,
+                    TOOLBAR_SLOT_SIZE,
+                    TOOLBAR_SLOT_SIZE,
+                    color,
+                    border_width=2 if is_selected else 1,
+                )
             )
 
             props = BLOCK_PROPERTIES.get(block_type, {})
             name = props.get("name", "?")[0]
-            arcade.draw_text(
-                name,
-                x + TOOLBAR_SLOT_SIZE / 2,
-                y + TOOLBAR_SLOT_SIZE / 2,
-                arcade.color.WHITE,
-                14,
-                anchor_x="center",
-                anchor_y="center",
+            self.toolbar_labels.append(
+                arcade.Text(
+                    name,
+                    x + TOOLBAR_SLOT_SIZE / 2,
+                    y + TOOLBAR_SLOT_SIZE / 2,
+                    arcade.color.WHITE,
+                    14,
+                    anchor_x="center",
+                    anchor_y="center",
+                    batch=self.toolbar_batch,
+                )
             )
 
-            arcade.draw_text(str(i + 1), x + 2, y + 2, arcade.color.GRAY, 10)
+            self.toolbar_labels.append(
+                arcade.Text(
+                    str(i + 1),
+                    x + 2,
+                    y + 2,
+                    arcade.color.GRAY,
+                    10,
+                    batch=self.toolbar_batch,
+                )
+            )
@@ -0,0 +1,17 @@
+"""Rendering helpers used by RenderProcessor."""
+
+from src.rendering.beams import BeamBatch
+from src.rendering.chunked_layer import ChunkedSpriteLayer
+from src.rendering.floor_chunks import FloorChunkRenderer
+from src.rendering.instanced import InstanceBatch
+from src.rendering.particles import ParticlePool
+from src.rendering.starfield import Starfield
+
+__all__ = [
+    "BeamBatch",
+    "ChunkedSpriteLayer",
+    "FloorChunkRenderer",
+    "InstanceBatch",
+    "ParticlePool",
+    "Starfield",
+]
@@ -0,0 +1,126 @@
+from collections.abc import Callable
+
+import arcade
+import numpy as np
+from arcade.gl import BufferDescription
+
+INITIAL_CAPACITY = 64
+
+# Per segment: x1, y1, x2, y2, width, r, g, b, a
+SEGMENT_FLOATS = 9
+
+# Per vertex: x, y, r, g, b, a
+VERTEX_FLOATS = 6
+# Two triangles per segment
+SEGMENT_VERTICES = 6
+
+# Where an entity is drawn in the current frame, or None once it is gone
+DrawPositionFn = Callable[[int], tuple[float, float] | None]
+
+
+class BeamBatch:
+    """Straight line segments of any width and colour, drawn in one call.
+
+    Segments are collected with ``add`` into a NumPy array; ``draw`` turns
+    them all into quads with a few whole-array operations and renders them
+    from a single vertex buffer. Segments stay until ``clear``.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.count = 0
+        self.segments = np.zeros((capacity, SEGMENT_FLOATS), dtype=np.float32)
+
+        # Program, vertex buffer and geometry, created on first draw
+        self._gl: (
+            tuple[arcade.gl.Program, arcade.gl.Buffer, arcade.gl.Geometry] | None
+        ) = None
+
+    def add(
+        self,
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+        color: arcade.types.RGBOrA255,
+        width: float = 1.0,
+    ) -> None:
+        """Add a segment ``width`` pixels wide, like ``arcade.draw_line``."""
+        if self.count == len(self.segments):
+            segments = np.zeros((self.count * 2, SEGMENT_FLOATS), dtype=np.float32)
+            segments[: self.count] = self.segments
+            self.segments = segments
+
+        color = arcade.types.Color.from_iterable(color)
+        self.segments[self.count] = (x1, y1, x2, y2, width, *color.normalized)
+        self.count += 1
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def draw(self) -> None:
+        """Draw with the current camera."""
+        n = self.count
+        if n == 0:
+            return
+
+        ctx = arcade.get_window().ctx
+        if self._gl is None:
+            self._gl = self._create_gl_objects(ctx)
+        program, buffer, geometry = self._gl
+
+        vertices = self._vertices()
+        if buffer.size < vertices.nbytes:
+            buffer.orphan(vertices.nbytes * 2)
+        buffer.write(vertices.tobytes())
+
+        with ctx.enabled(ctx.BLEND):
+            geometry.render(program, vertices=n * SEGMENT_VERTICES)
+
+    def _vertices(self) -> np.ndarray:
+        segments = self.segments[: self.count]
+        x1, y1, x2, y2, width = segments[:, :5].T
+
+        # Half-width offset perpendicular to each segment
+        dx = x2 - x1
+        dy = y2 - y1
+        length = np.hypot(dx, dy)
+        scale = np.divide(
+            width / 2, length, out=np.zeros_like(length), where=length > 0
+        )
+        nx = -dy * scale
+        ny = dx * scale
+
+        vertices = np.empty(
+            (self.count, SEGMENT_VERTICES, VERTEX_FLOATS), dtype=np.float32
+        )
+        # Corners in order: start left, start right, end left, end right
+        corners = (
+            (x1 + nx, y1 + ny),
+            (x1 - nx, y1 - ny),
+            (x2 + nx, y2 + ny),
+            (x2 - nx, y2 - ny),
+        )
+        for vertex, corner in enumerate((0, 1, 2, 2, 1, 3)):
+            vertices[:, vertex, 0], vertices[:, vertex, 1] = corners[corner]
+        vertices[:, :, 2:] = segments[:, np.newaxis, 5:]
+        return vertices
+
+    def _create_gl_objects(
+        self, ctx: arcade.ArcadeContext
+    ) -> tuple[arcade.gl.Program, arcade.gl.Buffer, arcade.gl.Geometry]:
+        program = ctx.load_program(
+            vertex_shader="shaders/beams_vs.glsl",
+            fragment_shader="shaders/beams_fs.glsl",
+        )
+        buffer = ctx.buffer(
+            reserve=len(self.segments) * SEGMENT_VERTICES * VERTEX_FLOATS * 4
+        )
+        geometry = ctx.geometry(
+            [BufferDescription(buffer, "2f 4f", ["in_pos", "in_color"])],
+            mode=ctx.TRIANGLES,
+        )
+        return program, buffer, geometry
+
+
+# Adds one kind of beam to a batch, placed with a DrawPositionFn
+BeamSource = Callable[[BeamBatch, DrawPositionFn], None]
@@ -0,0 +1,75 @@
+import math
+from collections.abc import Iterator
+
+import arcade
+from arcade.types import Rect
+
+ChunkKey = tuple[int, int]
+
+
+class ChunkedSpriteLayer:
+    """Static sprite layer split into square world chunks.
+
+    Every chunk is its own SpriteList, so ``draw`` only uploads and draws
+    the chunks that intersect the view. A sprite belongs to the chunk its
+    center falls in when it is appended; sprites in this layer are not
+    expected to move afterwards. ``sprite.remove_from_sprite_lists()``
+    works as usual.
+    """
+
+    def __init__(self, chunk_size: float, margin: float = 0.0):
+        self.chunk_size = chunk_size
+        # How far a sprite may stick out of the chunk its center is in
+        self.margin = margin
+        self.chunks: dict[ChunkKey, arcade.SpriteList] = {}
+
+        # Stats of the last draw() call
+        self.chunks_drawn = 0
+        self.chunks_skipped = 0
+
+    def _key_for(self, x: float, y: float) -> ChunkKey:
+        return math.floor(x / self.chunk_size), math.floor(y / self.chunk_size)
+
+    def append(self, sprite: arcade.Sprite) -> None:
+        key = self._key_for(sprite.center_x, sprite.center_y)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = self.chunks[key] = arcade.SpriteList()
+        chunk.append(sprite)
+
+    def clear(self) -> None:
+        for chunk in self.chunks.values():
+            chunk.clear()
+        self.chunks.clear()
+
+    def visible_chunks(self, view: Rect) -> Iterator[arcade.SpriteList]:
+        min_cx, min_cy = self._key_for(
+            view.left - self.margin, view.bottom - self.margin
+        )
+        max_cx, max_cy = self._key_for(view.right + self.margin, view.top + self.margin)
+
+        # Zoomed far out the view can cover more keys than there are chunks
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self.chunks):
+            for (cx, cy), sprites in self.chunks.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    yield sprites
+            return
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                chunk = self.chunks.get((cx, cy))
+                if chunk is not None:
+                    yield chunk
+
+    def draw(self, view: Rect, *, pixelated: bool = False) -> None:
+        drawn = 0
+        for chunk in self.visible_chunks(view):
+            if len(chunk):
+                chunk.draw(pixelated=pixelated)
+                drawn += 1
+
+        self.chunks_drawn = drawn
+        self.chunks_skipped = len(self.chunks) - drawn
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks.values())
@@ -0,0 +1,174 @@
+import itertools
+from collections.abc import Callable, Sequence
+
+import arcade
+import PIL.Image
+
+from src.rendering.chunked_layer import ChunkedSpriteLayer
+
+ChunkKey = tuple[int, int]
+
+# Returns the tile texture index at a grid cell, or None for an empty cell
+TileIndexFn = Callable[[int, int], int | None]
+
+_chunk_ids = itertools.count()
+
+
+class FloorChunkRenderer:
+    """Draws autotiled floor as one pre-rendered sprite per chunk.
+
+    Tiles of a ``chunk_tiles`` x ``chunk_tiles`` block of grid cells are
+    composited into a single image once, and only the chunks marked dirty
+    by a build or remove are baked again. Chunk sprites go into a
+    ChunkedSpriteLayer with the same chunk size, so off-screen chunks are
+    culled as well.
+
+    ``set_detail`` swaps the chunk sprites to copies downsampled by a power
+    of two, for zoom levels where a full-size chunk texture would cover far
+    fewer pixels than it has texels.
+    """
+
+    def __init__(
+        self,
+        layer: ChunkedSpriteLayer,
+        tile_images: Sequence[PIL.Image.Image],
+        tile_size: int,
+        scale: float,
+        chunk_tiles: int,
+        fallback_color: arcade.types.Color = arcade.color.DARK_GRAY,
+    ):
+        self.layer = layer
+        self.tile_images = tile_images
+        self.tile_size = tile_size
+        self.scale = scale
+        self.chunk_tiles = chunk_tiles
+        self.fallback_tile = PIL.Image.new(
+            "RGBA", (tile_size, tile_size), tuple(fallback_color)
+        )
+
+        self.chunks: dict[ChunkKey, arcade.Sprite] = {}
+        self.dirty: set[ChunkKey] = set()
+
+        # Full-size texture of every chunk, and its downsampled copies by
+        # level, made on first use
+        self.textures: dict[ChunkKey, arcade.Texture] = {}
+        self.mips: dict[ChunkKey, dict[int, arcade.Texture]] = {}
+        self.detail = 0
+
+    def chunk_for(self, gx: int, gy: int) -> ChunkKey:
+        return gx // self.chunk_tiles, gy // self.chunk_tiles
+
+    def mark_dirty(self, gx: int, gy: int) -> None:
+        self.dirty.add(self.chunk_for(gx, gy))
+
+    def clear(self) -> None:
+        for sprite in self.chunks.values():
+            sprite.remove_from_sprite_lists()
+        self.chunks.clear()
+        self.dirty.clear()
+        self.textures.clear()
+        self.mips.clear()
+
+    def set_detail(self, level: int) -> None:
+        """Draw chunks from textures downsampled by ``2 ** level``."""
+        if level == self.detail:
+            return
+
+        self.detail = level
+        for key, sprite in self.chunks.items():
+            self._apply_detail(key, sprite)
+
+    def bake(self, tile_index: TileIndexFn) -> int:
+        """Re-render every dirty chunk. Returns the number of chunks baked."""
+        baked = len(self.dirty)
+        for key in self.dirty:
+            self._bake_chunk(key, tile_index)
+        self.dirty.clear()
+        return baked
+
+    def _bake_chunk(self, key: ChunkKey, tile_index: TileIndexFn) -> None:
+        cx, cy = key
+        n = self.chunk_tiles
+        size = n * self.tile_size
+
+        sprite = self.chunks.get(key)
+        if sprite is None:
+            image = PIL.Image.new("RGBA", (size, size))
+        else:
+            image = self.textures[key].image
+            image.paste((0, 0, 0, 0), (0, 0, size, size))
+
+        empty = True
+        for ly in range(n):
+            for lx in range(n):
+                index = tile_index(cx * n + lx, cy * n + ly)
+                if index is None:
+                    continue
+
+                empty = False
+                tile = (
+                    self.tile_images[index]
+                    if 0 <= index < len(self.tile_images)
+                    else self.fallback_tile
+                )
+                # Image rows go down, grid rows go up
+                image.paste(tile, (lx * self.tile_size, (n - 1 - ly) * self.tile_size))
+
+        if empty:
+            if sprite is not None:
+                sprite.remove_from_sprite_lists()
+                del self.chunks[key]
+                del self.textures[key]
+                self.mips.pop(key, None)
+            return
+
+        if sprite is not None:
+            # Same image objects, so only the atlas regions need refreshing
+            self._update_atlas(self.textures[key])
+            for level, mip in self.mips.get(key, {}).items():
+                mip.image.paste(self._downsample(image, level))
+                self._update_atlas(mip)
+            return
+
+        texture = arcade.Texture(
+            image,
+            hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+            hash=f"floor-chunk-{next(_chunk_ids)}",
+        )
+        sprite = arcade.Sprite(texture, scale=self.scale)
+
+        world_size = size * self.scale
+        sprite.center_x = (cx + 0.5) * world_size
+        sprite.center_y = (cy + 0.5) * world_size
+
+        self.textures[key] = texture
+        self._apply_detail(key, sprite)
+        self.layer.append(sprite)
+        self.chunks[key] = sprite
+
+    def _apply_detail(self, key: ChunkKey, sprite: arcade.Sprite) -> None:
+        level = self.detail
+        sprite.texture = self.textures[key] if level == 0 else self._mip(key, level)
+        sprite.scale = self.scale * 2**level
+
+    def _mip(self, key: ChunkKey, level: int) -> arcade.Texture:
+        mips = self.mips.setdefault(key, {})
+        if level not in mips:
+            full = self.textures[key]
+            mips[level] = arcade.Texture(
+                self._downsample(full.image, level),
+                hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+                hash=f"{full.atlas_name}-mip{level}",
+            )
+        return mips[level]
+
+    @staticmethod
+    def _downsample(image: PIL.Image.Image, level: int) -> PIL.Image.Image:
+        size = max(1, image.width >> level), max(1, image.height >> level)
+        return image.resize(size, PIL.Image.Resampling.BOX)
+
+    @staticmethod
+    def _update_atlas(texture: arcade.Texture) -> None:
+        atlas = arcade.get_window().ctx.default_atlas
+        if atlas.has_texture(texture):
+            atlas.update_texture_image(texture)
@@ -0,0 +1,147 @@
+from collections.abc import Sequence
+
+import arcade
+import numpy as np
+import numpy.typing as npt
+from arcade.gl import BufferDescription
+
+PALETTE_SIZE = 8  # length of u_palette in shaders/instanced_vs.glsl
+# Palette index of removed rows, always transparent
+HIDDEN_COLOR = PALETTE_SIZE - 1
+INITIAL_CAPACITY = 256
+
+# Per instance: x, y, angle, palette index
+INSTANCE_FLOATS = 4
+
+
+class InstanceBatch:
+    """Many circles of one size drawn with a single instanced draw call.
+
+    Instances have no objects of their own: their data is one row each of
+    ``data``, which ``draw`` uploads as the per-instance vertex buffer. The
+    owner fills rows ``0..count - 1`` with whole-array writes, typically
+    straight from a PhysicsStore.
+
+    Rows can also be handed out one at a time with ``add``. A row given back
+    with ``remove`` is hidden and reused by the next ``add``, so the other
+    rows keep their place.
+    """
+
+    def __init__(
+        self,
+        radius: float,
+        palette: Sequence[arcade.types.RGBOrA255],
+        capacity: int = INITIAL_CAPACITY,
+    ):
+        if len(palette) > HIDDEN_COLOR:
+            raise ValueError(f"palette has more than {HIDDEN_COLOR} colours")
+
+        self.radius = radius
+        self.palette = [arcade.types.Color.from_iterable(c) for c in palette]
+        self.count = 0
+        self.data: npt.NDArray[np.float32] = np.zeros(
+            (capacity, INSTANCE_FLOATS), dtype=np.float32
+        )
+        # Removed rows below count, reused by add()
+        self.free_rows: list[int] = []
+
+        # Program, instance buffer and geometry, created on first draw
+        self._gl: (
+            tuple[arcade.gl.Program, arcade.gl.Buffer, arcade.gl.Geometry] | None
+        ) = None
+
+    @property
+    def x(self) -> npt.NDArray[np.float32]:
+        return self.data[: self.count, 0]
+
+    @property
+    def y(self) -> npt.NDArray[np.float32]:
+        return self.data[: self.count, 1]
+
+    @property
+    def angle(self) -> npt.NDArray[np.float32]:
+        return self.data[: self.count, 2]
+
+    @property
+    def color(self) -> npt.NDArray[np.float32]:
+        return self.data[: self.count, 3]
+
+    def resize(self, count: int) -> None:
+        """Set the number of instances. Rows beyond the old count are zero."""
+        if count > len(self.data):
+            capacity = len(self.data)
+            while capacity < count:
+                capacity *= 2
+            data = np.zeros((capacity, INSTANCE_FLOATS), dtype=np.float32)
+            data[: self.count] = self.data[: self.count]
+            self.data = data
+        elif count > self.count:
+            self.data[self.count : count] = 0
+
+        self.count = count
+
+    def add(self) -> int:
+        """Take a row for a new instance, reusing a removed one if any."""
+        if self.free_rows:
+            return self.free_rows.pop()
+
+        self.resize(self.count + 1)
+        return self.count - 1
+
+    def remove(self, row: int) -> None:
+        """Hide ``row`` until ``add`` hands it out again."""
+        self.data[row, 3] = HIDDEN_COLOR
+        self.free_rows.append(row)
+
+    def clear(self) -> None:
+        self.count = 0
+        self.free_rows.clear()
+
+    def draw(self) -> None:
+        """Draw with the current camera."""
+        n = self.count
+        if n == 0:
+            return
+
+        ctx = arcade.get_window().ctx
+        if self._gl is None:
+            self._gl = self._create_gl_objects(ctx)
+        program, buffer, geometry = self._gl
+
+        if buffer.size < self.data.nbytes:
+            buffer.orphan(self.data.nbytes)
+        buffer.write(self.data[:n].tobytes())
+
+        with ctx.enabled(ctx.BLEND):
+            geometry.render(program, instances=n)
+
+    def _create_gl_objects(
+        self, ctx: arcade.ArcadeContext
+    ) -> tuple[arcade.gl.Program, arcade.gl.Buffer, arcade.gl.Geometry]:
+        program = ctx.load_program(
+            vertex_shader="shaders/instanced_vs.glsl",
+            fragment_shader="shaders/instanced_fs.glsl",
+        )
+        program["u_radius"] = self.radius
+
+        palette = [c.normalized for c in self.palette]
+        palette += [(0.0, 0.0, 0.0, 0.0)] * (PALETTE_SIZE - len(palette))
+        program["u_palette"] = [value for color in palette for value in color]
+
+        quad = ctx.buffer(
+            data=np.array([-1, -1, 1, -1, -1, 1, 1, 1], dtype=np.float32).tobytes()
+        )
+        buffer = ctx.buffer(reserve=self.data.nbytes)
+        geometry = ctx.geometry(
+            [
+                BufferDescription(quad, "2f", ["in_vert"]),
+                BufferDescription(
+                    buffer,
+                    "2f 1f 1f",
+                    ["in_pos", "in_angle", "in_color"],
+                    instanced=True,
+                ),
+            ],
+            mode=ctx.TRIANGLE_STRIP,
+        )
+        return program, buffer, geometry
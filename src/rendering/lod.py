@@ -0,0 +1,34 @@
+# Level of detail tiers, from closest to farthest zoom
+LOD_FULL = 0
+LOD_REDUCED = 1
+LOD_FAR = 2
+
+# Camera zoom below which each tier starts
+LOD_REDUCED_ZOOM = 0.5
+LOD_FAR_ZOOM = 0.3
+
+# Layers of RenderProcessor.sprite_lists and instance_batches that are not
+# drawn at a tier. A projectile is under 3 px wide at reduced zoom, and a
+# resource chunk under 2 px at far zoom.
+HIDDEN_LAYERS: dict[int, frozenset[str]] = {
+    LOD_FULL: frozenset(),
+    LOD_REDUCED: frozenset({"projectiles"}),
+    LOD_FAR: frozenset({"chunks", "projectiles"}),
+}
+
+# Floor chunk texture downsampling (see FloorChunkRenderer.set_detail). A
+# floor texel covers under 1.5 screen pixels below reduced zoom, where the
+# half-resolution copy loses next to nothing.
+FLOOR_DETAIL: dict[int, int] = {
+    LOD_FULL: 0,
+    LOD_REDUCED: 1,
+    LOD_FAR: 1,
+}
+
+
+def lod_for_zoom(zoom: float) -> int:
+    if zoom < LOD_FAR_ZOOM:
+        return LOD_FAR
+    if zoom < LOD_REDUCED_ZOOM:
+        return LOD_REDUCED
+    return LOD_FULL
@@ -0,0 +1,135 @@
+import math
+
+import arcade
+import numpy as np
+from arcade.gl import BufferDescription
+from pyglet import gl
+
+PARTICLE_CAPACITY = 4096
+
+# Per vertex: x, y, r, g, b, a
+VERTEX_FLOATS = 6
+
+
+class ParticlePool:
+    """Fixed-capacity pool of short-lived point particles.
+
+    Particle state lives in NumPy arrays with the live particles packed at
+    the front, so ``update`` is a few whole-array operations and ``draw``
+    renders every particle with one points draw call. Particles emitted
+    while the pool is full are dropped.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, drag: float = 0.9):
+        self.capacity = capacity
+        self.drag = drag
+        self.count = 0
+        self.rng = np.random.default_rng()
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.dx = np.zeros(capacity, dtype=np.float32)
+        self.dy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.float32)
+
+        self._vertices = np.zeros((capacity, VERTEX_FLOATS), dtype=np.float32)
+        # Program, vertex buffer and geometry, created on first draw
+        self._gl: (
+            tuple[arcade.gl.Program, arcade.gl.Buffer, arcade.gl.Geometry] | None
+        ) = None
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        color: arcade.types.RGBOrA255,
+        count: int,
+        speed: tuple[float, float] = (30.0, 100.0),
+        life: tuple[float, float] = (0.3, 0.6),
+    ) -> None:
+        n = min(count, self.capacity - self.count)
+        if n <= 0:
+            return
+
+        new = slice(self.count, self.count + n)
+        angle = self.rng.uniform(0.0, 2 * math.pi, n)
+        velocity = self.rng.uniform(speed[0], speed[1], n)
+        lifetime = self.rng.uniform(life[0], life[1], n)
+
+        self.x[new] = x
+        self.y[new] = y
+        self.dx[new] = np.cos(angle) * velocity
+        self.dy[new] = np.sin(angle) * velocity
+        self.life[new] = lifetime
+        self.max_life[new] = lifetime
+        self.color[new] = np.asarray(color[:3], dtype=np.float32) / 255.0
+
+        self.count += n
+
+    def update(self, dt: float) -> None:
+        n = self.count
+        if n == 0:
+            return
+
+        self.life[:n] -= dt
+        self.x[:n] += self.dx[:n] * dt
+        self.y[:n] += self.dy[:n] * dt
+        self.dx[:n] *= self.drag
+        self.dy[:n] *= self.drag
+
+        alive = np.flatnonzero(self.life[:n] > 0)
+        if len(alive) == n:
+            return
+
+        for array in (
+            self.x,
+            self.y,
+            self.dx,
+            self.dy,
+            self.life,
+            self.max_life,
+            self.color,
+        ):
+            array[: len(alive)] = array[alive]
+        self.count = len(alive)
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def draw(self, point_size: float) -> None:
+        """Draw with the current camera; ``point_size`` is in pixels."""
+        n = self.count
+        if n == 0:
+            return
+
+        ctx = arcade.get_window().ctx
+        if self._gl is None:
+            self._gl = self._create_gl_objects(ctx)
+        program, buffer, geometry = self._gl
+
+        vertices = self._vertices[:n]
+        vertices[:, 0] = self.x[:n]
+        vertices[:, 1] = self.y[:n]
+        vertices[:, 2:5] = self.color[:n]
+        vertices[:, 5] = self.life[:n] / self.max_life[:n]
+        buffer.write(vertices.tobytes())
+
+        program["u_point_size"] = point_size
+        with ctx.enabled(ctx.BLEND, gl.GL_PROGRAM_POINT_SIZE):
+            geometry.render(program, mode=ctx.POINTS, vertices=n)
+
+    def _create_gl_objects(
+        self, ctx: arcade.ArcadeContext
+    ) -> tuple[arcade.gl.Program, arcade.gl.Buffer, arcade.gl.Geometry]:
+        program = ctx.load_program(
+            vertex_shader="shaders/particles_vs.glsl",
+            fragment_shader="shaders/particles_fs.glsl",
+        )
+        buffer = ctx.buffer(reserve=self._vertices.nbytes)
+        geometry = ctx.geometry(
+            [BufferDescription(buffer, "2f 4f", ["in_pos", "in_color"])],
+            mode=ctx.POINTS,
+        )
+        return program, buffer, geometry
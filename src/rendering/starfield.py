@@ -0,0 +1,72 @@
+import arcade
+
+
+class Starfield:
+    """Animated star background drawn by ``shaders/stars.frag``.
+
+    The shader runs for every pixel it covers, so with ``scale`` below 1 it
+    renders into an offscreen texture of ``scale`` times the framebuffer
+    size, which is then stretched over the window with linear filtering.
+    With ``update_rate`` set, that texture is only re-rendered that many
+    times per second and the cached one is drawn in between.
+    """
+
+    def __init__(
+        self,
+        ctx: arcade.ArcadeContext,
+        size: tuple[int, int],
+        scale: float = 1.0,
+        update_rate: float | None = None,
+    ):
+        self.ctx = ctx
+        self.scale = scale
+        self.update_rate = update_rate
+
+        self.quad_fs = arcade.gl.geometry.quad_2d_fs()
+        self.program = ctx.load_program(
+            fragment_shader="shaders/stars.frag",
+            vertex_shader="shaders/default_vs.glsl",
+        )
+
+        self.framebuffer: arcade.gl.Framebuffer | None = None
+        self._rendered_time: float | None = None
+        self.resize(*size)
+
+    @property
+    def offscreen(self) -> bool:
+        return self.scale < 1.0 or self.update_rate is not None
+
+    def resize(self, width: int, height: int) -> None:
+        """Match a framebuffer of ``width`` x ``height`` pixels."""
+        if not self.offscreen:
+            self.framebuffer = None
+            self.program["u_resolution"] = (width, height)
+            return
+
+        size = max(1, round(width * self.scale)), max(1, round(height * self.scale))
+        texture = self.ctx.texture(size, filter=(self.ctx.LINEAR, self.ctx.LINEAR))
+        self.framebuffer = self.ctx.framebuffer(color_attachments=[texture])
+        self.program["u_resolution"] = size
+        self._rendered_time = None
+
+    def draw(self, time: float) -> None:
+        if self.framebuffer is None:
+            self.program["u_time"] = time
+            self.quad_fs.render(self.program)
+            return
+
+        if self._needs_render(time):
+            self.program["u_time"] = time
+            with self.framebuffer.activate():
+                self.quad_fs.render(self.program)
+            self._rendered_time = time
+
+        self.framebuffer.color_attachments[0].use(0)
+        self.quad_fs.render(self.ctx.utility_textured_quad_program)
+
+    def _needs_render(self, time: float) -> bool:
+        if self._rendered_time is None or self.update_rate is None:
+            return True
+
+        elapsed = time - self._rendered_time
+        return elapsed < 0 or elapsed >= 1.0 / self.update_rate
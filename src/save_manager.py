@@ -9,6 +9,7 @@ from src.processors.builder import BuilderProcessor
 from src.processors.render import RenderProcessor
 from src.entities.player import create_player
 from src.entities.asteroids import create_asteroid
+from src.systems.spatial_index import SpatialIndexService
 
 SAVE_FILE = "savegame.json"
 
@@ -62,7 +63,11 @@ def save_game(builder: BuilderProcessor):
         print(f"Error saving game: {e}")
 
 
-def load_game(builder: BuilderProcessor, render_processor: RenderProcessor):
+def load_game(
+    builder: BuilderProcessor,
+    render_processor: RenderProcessor,
+    spatial_index: SpatialIndexService,
+):
     print("Loading game...")
     try:
         with open(SAVE_FILE, "r") as f:
@@ -76,6 +81,8 @@ def load_game(builder: BuilderProcessor, render_processor: RenderProcessor):
 
     esper.clear_database()
     render_processor.clear_all_sprites()
+    # Entity ids start over, so the old ones must not linger in the index
+    spatial_index.clear()
 
     # Recreate World Entity
     world_map_ent = esper.create_entity(WorldMap())
@@ -1,5 +1,7 @@
 """Spatial partitioning module."""
 
 from src.spatial.quadtree import QuadTree, Point, Rectangle
+from src.spatial.hash_grid import SpatialHashGrid
+from src.spatial.array_index import ArraySpatialIndex
 
-__all__ = ["QuadTree", "Point", "Rectangle"]
+__all__ = ["QuadTree", "Point", "Rectangle", "SpatialHashGrid", "ArraySpatialIndex"]
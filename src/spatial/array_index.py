@@ -0,0 +1,161 @@
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+
+class ArraySpatialIndex:
+    """Static point index stored as flat NumPy arrays.
+
+    Points are bucketed into square cells and sorted by a row-major cell
+    key, so every row of cells a query touches is one contiguous slice of
+    the arrays. A whole batch of radius queries is answered with a fixed
+    number of vectorized operations instead of one tree walk per query.
+
+    The index is rebuilt with ``build`` whenever the points move; building
+    is a single sort and is cheap compared to incremental maintenance.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.clear()
+
+    def clear(self) -> None:
+        self.xs: FloatArray = np.empty(0, dtype=np.float64)
+        self.ys: FloatArray = np.empty(0, dtype=np.float64)
+        self.ids: IntArray = np.empty(0, dtype=np.int64)
+        self.keys: IntArray = np.empty(0, dtype=np.int64)
+
+        self._min_cx = 0
+        self._min_cy = 0
+        self._max_cx = -1
+        self._max_cy = -1
+        self._row_width = 0
+
+    def build(self, xs: npt.ArrayLike, ys: npt.ArrayLike, ids: npt.ArrayLike) -> None:
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        ids = np.asarray(ids, dtype=np.int64)
+
+        if len(xs) == 0:
+            self.clear()
+            return
+
+        cx = np.floor(xs / self.cell_size).astype(np.int64)
+        cy = np.floor(ys / self.cell_size).astype(np.int64)
+
+        self._min_cx, self._max_cx = int(cx.min()), int(cx.max())
+        self._min_cy, self._max_cy = int(cy.min()), int(cy.max())
+        self._row_width = self._max_cx - self._min_cx + 1
+
+        keys = (cy - self._min_cy) * self._row_width + (cx - self._min_cx)
+        order = np.argsort(keys, kind="stable")
+
+        self.xs = xs[order]
+        self.ys = ys[order]
+        self.ids = ids[order]
+        self.keys = keys[order]
+
+    def count(self) -> int:
+        return len(self.ids)
+
+    def query_radius_batch(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike, radii: npt.ArrayLike
+    ) -> tuple[IntArray, IntArray]:
+        """Radius query for every (xs[i], ys[i], radii[i]).
+
+        Returns CSR-style ``(offsets, ids)``: the hits of query i are
+        ``ids[offsets[i]:offsets[i + 1]]``.
+        """
+        qx, qy, qr = self._as_queries(xs, ys, radii)
+        query, slot, _ = self._candidates(qx, qy, qr)
+
+        counts = np.bincount(query, minlength=len(qx))
+        offsets = np.zeros(len(qx) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        return offsets, self.ids[slot]
+
+    def nearest_batch(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike, radii: npt.ArrayLike
+    ) -> IntArray:
+        """Id of the closest point within radii[i] of each query, or -1."""
+        qx, qy, qr = self._as_queries(xs, ys, radii)
+        nearest = np.full(len(qx), -1, dtype=np.int64)
+
+        query, slot, dist_sq = self._candidates(qx, qy, qr)
+        if len(query) == 0:
+            return nearest
+
+        # Sort hits by (query, distance); the first hit of each query wins.
+        order = np.lexsort((dist_sq, query))
+        query = query[order]
+        first = np.ones(len(query), dtype=bool)
+        first[1:] = query[1:] != query[:-1]
+
+        nearest[query[first]] = self.ids[slot[order][first]]
+        return nearest
+
+    @staticmethod
+    def _as_queries(
+        xs: npt.ArrayLike, ys: npt.ArrayLike, radii: npt.ArrayLike
+    ) -> tuple[FloatArray, FloatArray, FloatArray]:
+        qx = np.asarray(xs, dtype=np.float64)
+        qy = np.asarray(ys, dtype=np.float64)
+        qr = np.broadcast_to(np.asarray(radii, dtype=np.float64), qx.shape)
+        return qx, qy, qr
+
+    def _candidates(
+        self, qx: FloatArray, qy: FloatArray, qr: FloatArray
+    ) -> tuple[IntArray, IntArray, FloatArray]:
+        """Flattened (query index, point slot, squared distance) of all hits.
+
+        Hits are grouped by query index in ascending order.
+        """
+        empty = np.empty(0, dtype=np.int64)
+        if len(self.ids) == 0 or len(qx) == 0:
+            return empty, empty, np.empty(0, dtype=np.float64)
+
+        cell = self.cell_size
+        cx0 = np.maximum(np.floor((qx - qr) / cell), self._min_cx) - self._min_cx
+        cx1 = np.minimum(np.floor((qx + qr) / cell), self._max_cx) - self._min_cx
+        cy0 = np.maximum(np.floor((qy - qr) / cell), self._min_cy) - self._min_cy
+        cy1 = np.minimum(np.floor((qy + qr) / cell), self._max_cy) - self._min_cy
+
+        cx0 = cx0.astype(np.int64)
+        cx1 = cx1.astype(np.int64)
+        cy0 = cy0.astype(np.int64)
+        cy1 = cy1.astype(np.int64)
+
+        # One (query, row) pair per row of cells the query's box covers.
+        rows = np.maximum(cy1 - cy0 + 1, 0)
+        rows[cx1 < cx0] = 0
+        pair_query = np.repeat(np.arange(len(qx)), rows)
+        pair_row = cy0[pair_query] + _ranges(rows)
+
+        row_start = pair_row * self._row_width
+        lo = np.searchsorted(self.keys, row_start + cx0[pair_query], side="left")
+        hi = np.searchsorted(self.keys, row_start + cx1[pair_query], side="right")
+
+        # Expand each row's contiguous slice into individual point slots.
+        spans = np.maximum(hi - lo, 0)
+        query = np.repeat(pair_query, spans)
+        slot = np.repeat(lo, spans) + _ranges(spans)
+
+        dx = self.xs[slot] - qx[query]
+        dy = self.ys[slot] - qy[query]
+        dist_sq = dx * dx + dy * dy
+
+        hit = dist_sq <= qr[query] * qr[query]
+        return query[hit], slot[hit], dist_sq[hit]
+
+
+def _ranges(lengths: IntArray) -> IntArray:
+    """Concatenation of arange(n) for every n in lengths."""
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.arange(total, dtype=np.int64) - starts
@@ -0,0 +1,94 @@
+import math
+
+from src.spatial.quadtree import Point
+
+Cell = tuple[int, int]
+
+
+class SpatialHashGrid:
+    """Uniform grid of square cells keyed by integer cell coordinates.
+
+    Best suited to radius queries whose radius is close to ``cell_size``:
+    such a query only has to look at the 3x3 block of cells around it.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = cell_size
+        self.cells: dict[Cell, dict[int, Point]] = {}
+        self._index: dict[int, Cell] = {}
+
+    def _cell_for(self, x: float, y: float) -> Cell:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, point: Point) -> bool:
+        if point.entity_id in self._index:
+            self.remove(point.entity_id)
+
+        cell = self._cell_for(point.x, point.y)
+        self.cells.setdefault(cell, {})[point.entity_id] = point
+        self._index[point.entity_id] = cell
+        return True
+
+    def remove(self, entity_id: int) -> bool:
+        cell = self._index.pop(entity_id, None)
+        if cell is None:
+            return False
+
+        bucket = self.cells[cell]
+        del bucket[entity_id]
+        if not bucket:
+            del self.cells[cell]
+        return True
+
+    def update(self, entity_id: int, x: float, y: float) -> bool:
+        cell = self._index.get(entity_id)
+        if cell is None:
+            return False
+
+        point = self.cells[cell][entity_id]
+        point.x = x
+        point.y = y
+
+        if self._cell_for(x, y) != cell:
+            self.insert(point)
+        return True
+
+    def contains(self, entity_id: int) -> bool:
+        return entity_id in self._index
+
+    def get(self, entity_id: int) -> Point | None:
+        cell = self._index.get(entity_id)
+        if cell is None:
+            return None
+
+        return self.cells[cell][entity_id]
+
+    def query_radius(
+        self, center_x: float, center_y: float, radius: float
+    ) -> list[int]:
+        result: list[int] = []
+        radius_sq = radius * radius
+
+        min_cx, min_cy = self._cell_for(center_x - radius, center_y - radius)
+        max_cx, max_cy = self._cell_for(center_x + radius, center_y + radius)
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self.cells.get((cx, cy))
+                if not bucket:
+                    continue
+
+                for point in bucket.values():
+                    dx = point.x - center_x
+                    dy = point.y - center_y
+                    if dx * dx + dy * dy <= radius_sq:
+                        result.append(point.entity_id)
+
+        return result
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self._index.clear()
+
+    def count(self) -> int:
+        return len(self._index)
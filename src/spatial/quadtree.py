@@ -1,5 +1,8 @@
+import heapq
+import itertools
+import math
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import List, Optional
 
 
 @dataclass
@@ -22,6 +25,18 @@ class Rectangle:
             and self.y - self.h <= point.y <= self.y + self.h
         )
 
+    def contains_xy(self, x: float, y: float) -> bool:
+        return (
+            self.x - self.w <= x <= self.x + self.w
+            and self.y - self.h <= y <= self.y + self.h
+        )
+
+    def distance_sq(self, x: float, y: float) -> float:
+        """Squared distance from (x, y) to the rectangle, 0 if inside."""
+        dx = max(self.x - self.w - x, 0.0, x - self.x - self.w)
+        dy = max(self.y - self.h - y, 0.0, y - self.y - self.h)
+        return dx * dx + dy * dy
+
     def intersects(self, other: "Rectangle") -> bool:
         return not (
             self.x + self.w < other.x - other.w
@@ -32,18 +47,56 @@ class Rectangle:
 
 
 class QuadTree:
-    def __init__(self, boundary: Rectangle, capacity: int = 4):
+    """Point quadtree with an entity_id index.
+
+    Nodes stop subdividing at ``max_depth``; a leaf at that depth keeps
+    every extra point in an overflow bucket, so piles of coincident points
+    cannot recurse forever. With ``looseness`` > 1 each node's bounds are
+    enlarged by that factor around its center: points are still placed by
+    their tight quadrant, but a moving point only relocates once it leaves
+    its leaf's loose bounds. Nodes freed by collapse/clear are pooled and
+    reused by later subdivisions.
+    """
+
+    def __init__(
+        self,
+        boundary: Rectangle,
+        capacity: int = 4,
+        max_depth: int = 12,
+        looseness: float = 1.0,
+    ):
         self.boundary = boundary
         self.capacity = capacity
-        self.points: List[Point] = []
+        self.max_depth = max_depth
+        self.looseness = looseness
+        self.depth = 0
+        self.loose_boundary = self._loosen(boundary)
+        self.points: dict[int, Point] = {}
         self.divided = False
 
-        self.northeast: Optional[QuadTree] = None
-        self.northwest: Optional[QuadTree] = None
-        self.southeast: Optional[QuadTree] = None
-        self.southwest: Optional[QuadTree] = None
+        self.parent: QuadTree | None = None
+        # entity_id -> leaf holding it, shared by every node of one tree
+        self._index: dict[int, QuadTree] = {}
+        # Detached nodes ready for reuse, shared by every node of one tree
+        self._pool: list[QuadTree] = []
+
+        self.northeast: QuadTree | None = None
+        self.northwest: QuadTree | None = None
+        self.southeast: QuadTree | None = None
+        self.southwest: QuadTree | None = None
 
-        self.children: List[Optional[QuadTree]] = []
+        self.children: list[QuadTree | None] = []
+
+    def _loosen(self, boundary: Rectangle) -> Rectangle:
+        if self.looseness == 1.0:
+            return boundary
+
+        return Rectangle(
+            boundary.x,
+            boundary.y,
+            boundary.w * self.looseness,
+            boundary.h * self.looseness,
+        )
 
     def subdivide(self) -> None:
         x, y, w, h = self.boundary.x, self.boundary.y, self.boundary.w, self.boundary.h
@@ -54,46 +107,96 @@ class QuadTree:
         se = Rectangle(x + hw, y - hh, hw, hh)
         sw = Rectangle(x - hw, y - hh, hw, hh)
 
-        self.northeast = QuadTree(ne, self.capacity)
-        self.northwest = QuadTree(nw, self.capacity)
-        self.southeast = QuadTree(se, self.capacity)
-        self.southwest = QuadTree(sw, self.capacity)
+        self.northeast = self._make_child(ne)
+        self.northwest = self._make_child(nw)
+        self.southeast = self._make_child(se)
+        self.southwest = self._make_child(sw)
 
         self.children = [self.northeast, self.northwest, self.southeast, self.southwest]
 
         self.divided = True
 
-    def insert(self, point: Point) -> bool:
-        if not self.boundary.contains(point):
-            return False
-
-        if len(self.points) < self.capacity and not self.divided:
-            self.points.append(point)
-            return True
-
-        if not self.divided:
-            self.subdivide()
+    def _make_child(self, boundary: Rectangle) -> "QuadTree":
+        if self._pool:
+            child = self._pool.pop()
+            child.boundary = boundary
+            child.loose_boundary = self._loosen(boundary)
+        else:
+            child = QuadTree(boundary, self.capacity, self.max_depth, self.looseness)
+            child._index = self._index
+            child._pool = self._pool
 
-            old_points = self.points
-            self.points = []
-            for p in old_points:
-                self._insert_into_children(p)
+        child.parent = self
+        child.depth = self.depth + 1
+        return child
 
-        return self._insert_into_children(point)
+    def insert(self, point: Point) -> bool:
+        if point.entity_id in self._index:
+            self.remove(point.entity_id)
 
-    def _insert_into_children(self, point: Point) -> bool:
-        for child in self.children:
-            if child and child.insert(point):
-                return True
-        return False
+        return self._insert(point)
 
-    def query(self, range_rect: Rectangle) -> List[int]:
-        found: List[int] = []
+    def _insert(self, point: Point) -> bool:
+        if not self.boundary.contains(point):
+            return False
 
-        if not self.boundary.intersects(range_rect):
+        self._place(point)
+        return True
+
+    def _place(self, point: Point) -> None:
+        node = self
+        while True:
+            if not node.divided:
+                if len(node.points) < node.capacity or node.depth >= node.max_depth:
+                    node._store(point)
+                    return
+
+                node.subdivide()
+
+                old_points = node.points
+                node.points = {}
+                for p in old_points.values():
+                    node._push_down(p)
+
+            child = node._child_for(point.x, point.y)
+            if not child.loose_boundary.contains(point):
+                node._store(point)
+                return
+
+            node = child
+
+    def _push_down(self, point: Point) -> None:
+        # A point kept by a loose leaf can lie outside its tight bounds and
+        # then fit no child's loose bounds; it stays on this node instead.
+        child = self._child_for(point.x, point.y)
+        if child.loose_boundary.contains(point):
+            child._place(point)
+        else:
+            self._store(point)
+
+    def _store(self, point: Point) -> None:
+        self.points[point.entity_id] = point
+        self._index[point.entity_id] = self
+
+    def _child_for(self, x: float, y: float) -> "QuadTree":
+        # Half-open quadrants: a point on the center line belongs to the
+        # east/north side, so edge points always land in the same child.
+        east = x >= self.boundary.x
+        north = y >= self.boundary.y
+        if north:
+            child = self.northeast if east else self.northwest
+        else:
+            child = self.southeast if east else self.southwest
+        assert child is not None
+        return child
+
+    def query(self, range_rect: Rectangle) -> list[int]:
+        found: list[int] = []
+
+        if not self.loose_boundary.intersects(range_rect):
             return found
 
-        for point in self.points:
+        for point in self.points.values():
             if range_rect.contains(point):
                 found.append(point.entity_id)
 
@@ -108,9 +211,9 @@ class QuadTree:
 
     def query_radius(
         self, center_x: float, center_y: float, radius: float
-    ) -> List[int]:
+    ) -> list[int]:
         range_rect = Rectangle(center_x, center_y, radius, radius)
-        result: List[int] = []
+        result: list[int] = []
         radius_sq = radius * radius
 
         self._query_radius_recursive(range_rect, center_x, center_y, radius_sq, result)
@@ -122,12 +225,12 @@ class QuadTree:
         cx: float,
         cy: float,
         radius_sq: float,
-        result: List[int],
+        result: list[int],
     ) -> None:
-        if not self.boundary.intersects(range_rect):
+        if not self.loose_boundary.intersects(range_rect):
             return
 
-        for point in self.points:
+        for point in self.points.values():
             dx = point.x - cx
             dy = point.y - cy
             if dx * dx + dy * dy <= radius_sq:
@@ -138,55 +241,193 @@ class QuadTree:
                 if child:
                     child._query_radius_recursive(range_rect, cx, cy, radius_sq, result)
 
-    def _find_point(self, entity_id: int) -> Optional[Point]:
-        for point in self.points:
-            if point.entity_id != entity_id:
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        max_radius: float = math.inf,
+        predicate: Callable[[int], bool] | None = None,
+    ) -> Point | None:
+        """Closest point within max_radius whose entity_id passes predicate."""
+        found = self.k_nearest(x, y, 1, max_radius, predicate)
+        return found[0] if found else None
+
+    def k_nearest(
+        self,
+        x: float,
+        y: float,
+        k: int,
+        max_radius: float = math.inf,
+        predicate: Callable[[int], bool] | None = None,
+    ) -> list[Point]:
+        """Up to k closest points within max_radius, nearest first.
+
+        Best-first branch and bound: nodes and points share one heap keyed
+        by squared distance (a node's key is the distance to its bounds),
+        so a point popped from the heap is closer than anything unexplored.
+        """
+        result: list[Point] = []
+        if k <= 0:
+            return result
+
+        radius_sq = max_radius * max_radius
+        tiebreak = itertools.count()
+        heap: list[tuple[float, int, QuadTree | Point]] = [
+            (self.loose_boundary.distance_sq(x, y), next(tiebreak), self)
+        ]
+
+        while heap:
+            dist_sq, _, item = heapq.heappop(heap)
+            if dist_sq > radius_sq:
+                break
+
+            if isinstance(item, Point):
+                result.append(item)
+                if len(result) == k:
+                    break
                 continue
 
-            return point
+            for point in item.points.values():
+                if predicate is not None and not predicate(point.entity_id):
+                    continue
 
-        if not self.divided:
+                dx = point.x - x
+                dy = point.y - y
+                point_dist_sq = dx * dx + dy * dy
+                if point_dist_sq <= radius_sq:
+                    heapq.heappush(heap, (point_dist_sq, next(tiebreak), point))
+
+            for child in item.children:
+                if not child:
+                    continue
+
+                child_dist_sq = child.loose_boundary.distance_sq(x, y)
+                if child_dist_sq <= radius_sq:
+                    heapq.heappush(heap, (child_dist_sq, next(tiebreak), child))
+
+        return result
+
+    def contains(self, entity_id: int) -> bool:
+        return entity_id in self._index
+
+    def get(self, entity_id: int) -> Point | None:
+        leaf = self._index.get(entity_id)
+        if leaf is None:
             return None
 
-        for child in self.children:
-            if not child:
-                continue
+        return leaf.points[entity_id]
+
+    def ids(self) -> list[int]:
+        return list(self._index)
 
-            result = child._find_point(entity_id)
-            if result:
-                return result
+    def update(self, entity_id: int, x: float, y: float) -> bool:
+        """Move a stored point to (x, y).
 
-        return None
+        The point is only relocated when it leaves the leaf that holds it,
+        so small per-frame drifts cost a single boundary check. Returns
+        False if the entity is unknown or the new position is outside the
+        tree, in which case the point is dropped.
+        """
+        leaf = self._index.get(entity_id)
+        if leaf is None:
+            return False
+
+        point = leaf.points[entity_id]
+        if leaf.loose_boundary.contains_xy(x, y):
+            point.x = x
+            point.y = y
+            return True
+
+        self.remove(entity_id)
+        point.x = x
+        point.y = y
+        return self._insert(point)
 
     def remove(self, entity_id: int) -> bool:
-        for i, point in enumerate(self.points):
-            if point.entity_id == entity_id:
-                self.points.pop(i)
-                return True
+        leaf = self._index.pop(entity_id, None)
+        if leaf is None:
+            return False
+
+        del leaf.points[entity_id]
 
+        node = leaf if leaf.divided else leaf.parent
+        while node is not None and node._collapse():
+            node = node.parent
+
+        return True
+
+    def _collapse(self) -> bool:
+        """Merge the children back into this node once they fit in it."""
         if not self.divided:
             return False
 
+        total = len(self.points)
         for child in self.children:
             if not child:
                 continue
 
-            if child.remove(entity_id):
-                return True
+            if child.divided:
+                return False
 
-        return False
+            total += len(child.points)
+
+        if total > self.capacity:
+            return False
+
+        merged: dict[int, Point] = dict(self.points)
+        for child in self.children:
+            if child:
+                merged.update(child.points)
+                child._release()
+
+        self._unlink_children()
+        self.points = merged
+        for entity_id in merged:
+            self._index[entity_id] = self
+
+        return True
+
+    def _unlink_children(self) -> None:
+        self.northeast = None
+        self.northwest = None
+        self.southeast = None
+        self.southwest = None
+        self.children = []
+        self.divided = False
+
+    def _release(self) -> None:
+        """Detach this subtree and return its nodes to the pool."""
+        for child in self.children:
+            if child:
+                child._release()
+
+        self._unlink_children()
+        self.points = {}
+        self.parent = None
+        self._pool.append(self)
 
     def clear(self) -> None:
+        for entity_id in self._collect_ids():
+            self._index.pop(entity_id, None)
+
         self.points.clear()
         if self.divided:
-            self.northeast = None
-            self.northwest = None
-            self.southeast = None
-            self.southwest = None
-            self.children = []
-            self.divided = False
+            for child in self.children:
+                if child:
+                    child._release()
+            self._unlink_children()
+
+    def _collect_ids(self) -> list[int]:
+        ids = list(self.points)
+        for child in self.children:
+            if child:
+                ids.extend(child._collect_ids())
+        return ids
 
     def count(self) -> int:
+        if self.parent is None:
+            return len(self._index)
+
         total = len(self.points)
         if self.divided:
             for child in self.children:
@@ -1,5 +1,13 @@
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
 import arcade
+import PIL.Image
 from arcade import SpriteList
+from arcade.types import RGBA255
+
+if TYPE_CHECKING:
+    from src.rendering.chunked_layer import ChunkedSpriteLayer
 
 type SpriteListType = SpriteList[arcade.Sprite]
 
@@ -20,6 +28,97 @@ except FileNotFoundError:
     platform_textures = []
 
 
+# Textures generated at runtime, shared by every sprite with the same shape
+# and size. They are white; each sprite is tinted through sprite.color.
+_shape_textures: dict[tuple[str, int, int], arcade.Texture] = {}
+
+
+def get_shape_texture(shape: str, width: int, height: int) -> arcade.Texture:
+    key = (shape, width, height)
+    texture = _shape_textures.get(key)
+    if texture is None:
+        if shape == "circle":
+            texture = arcade.make_circle_texture(width, arcade.color.WHITE)
+        else:
+            texture = arcade.Texture(
+                PIL.Image.new("RGBA", (width, height), arcade.color.WHITE),
+                hash=f"solid-{width}x{height}",
+            )
+        _shape_textures[key] = texture
+    return texture
+
+
+def create_circle_sprite(radius: int, color: RGBA255) -> arcade.Sprite:
+    sprite = arcade.Sprite(get_shape_texture("circle", radius * 2, radius * 2))
+    sprite.color = color
+    return sprite
+
+
+def create_solid_sprite(width: int, height: int, color: RGBA255) -> arcade.Sprite:
+    sprite = arcade.Sprite(get_shape_texture("solid", width, height))
+    sprite.color = color
+    return sprite
+
+
+class SpritePool:
+    """Recycles the sprites of one SpriteList.
+
+    Removing a sprite from a SpriteList shifts its index buffer, so sprites
+    that come and go every few frames (projectiles) are hidden on release
+    instead and handed out again by the next acquire(). The list only grows
+    when every pooled sprite is in use.
+    """
+
+    def __init__(
+        self,
+        sprite_list: SpriteListType,
+        factory: Callable[[], arcade.Sprite],
+        reserve: int = 0,
+    ):
+        self.sprite_list = sprite_list
+        self.factory = factory
+        self.free: list[arcade.Sprite] = []
+        self.reserve(reserve)
+
+    def reserve(self, count: int) -> None:
+        """Pre-allocate count hidden sprites."""
+        for _ in range(count):
+            sprite = self.factory()
+            sprite.visible = False
+            self.sprite_list.append(sprite)
+            self.free.append(sprite)
+
+    def acquire(self, x: float, y: float, color: RGBA255) -> arcade.Sprite:
+        if self.free:
+            sprite = self.free.pop()
+            sprite.angle = 0
+            sprite.visible = True
+        else:
+            sprite = self.factory()
+            self.sprite_list.append(sprite)
+
+        sprite.position = x, y
+        sprite.color = color
+        return sprite
+
+    def release(self, sprite: arcade.Sprite) -> None:
+        if not sprite.visible:
+            return  # Already released
+
+        sprite.visible = False
+        self.free.append(sprite)
+
+    def reset(self) -> None:
+        """Release every sprite, e.g. after the world was cleared."""
+        for sprite in self.sprite_list:
+            sprite.visible = False
+        self.free = list(self.sprite_list)
+
+    @property
+    def in_use(self) -> int:
+        return len(self.sprite_list) - len(self.free)
+
+
 def create_asteroid_sprite(target_list: SpriteListType) -> arcade.Sprite:
     new_sprite = arcade.Sprite(asteroid_texture)
     target_list.append(new_sprite)
@@ -27,7 +126,7 @@ def create_asteroid_sprite(target_list: SpriteListType) -> arcade.Sprite:
 
 
 def create_platform_tile(
-    target_list: SpriteListType,
+    target_list: "SpriteListType | ChunkedSpriteLayer",
     texture_index: int,
     center_x: float,
     center_y: float,
@@ -37,8 +136,8 @@ def create_platform_tile(
         tex = platform_textures[texture_index]
         new_sprite = arcade.Sprite(tex, scale=scale)
     else:
-        new_sprite = arcade.SpriteSolidColor(
-            int(16 * scale), int(16 * scale), color=arcade.color.DARK_GRAY
+        new_sprite = create_solid_sprite(
+            int(16 * scale), int(16 * scale), arcade.color.DARK_GRAY
         )
 
     new_sprite.center_x = center_x
@@ -50,7 +149,7 @@ def create_platform_tile(
 
 
 def create_ship_sprite(target_list: SpriteListType) -> arcade.Sprite:
-    new_sprite = arcade.SpriteSolidColor(24, 24, color=arcade.color.CYAN)
+    new_sprite = create_solid_sprite(24, 24, arcade.color.CYAN)
 
     target_list.append(new_sprite)
     return new_sprite
@@ -0,0 +1,250 @@
+import esper
+import numpy as np
+import numpy.typing as npt
+
+from src.components.gameplay import ResourceSource
+from src.components.physics import Position, Velocity
+from src.game_data import MAP_LIMIT_X, MAP_LIMIT_Y
+
+# Limit classes, indexes into the tables below
+LIMIT_MAP = 0
+LIMIT_ASTEROID = 1
+
+LIMITS_X = np.array([MAP_LIMIT_X, MAP_LIMIT_X * 1.5], dtype=np.float64)
+LIMITS_Y = np.array([MAP_LIMIT_Y, MAP_LIMIT_Y * 1.5], dtype=np.float64)
+# Bodies of a culled class are deleted when they leave their limits
+# instead of being clamped to them.
+CULLED = np.array([False, True])
+
+INITIAL_CAPACITY = 256
+
+
+class PhysicsStore:
+    """Structure-of-arrays storage for every (Position, Velocity) body.
+
+    Slots ``0..count - 1`` are dense: removing a body moves the last one into
+    its slot, so the first ``count`` elements of each array can be processed
+    with whole-array operations. Bound components read and write their slot,
+    see ``Position``.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.count = 0
+        self.x: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self.y: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self.dx: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self.dy: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        # Positions at the start of the current simulation step
+        self.prev_x: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self.prev_y: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        # Positions last pushed to sprites; NaN until the first push
+        self.drawn_x: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self.drawn_y: npt.NDArray[np.float64] = np.zeros(capacity, dtype=np.float64)
+        self.limit_class: npt.NDArray[np.uint8] = np.zeros(capacity, dtype=np.uint8)
+
+        self.entities: list[int] = []
+        self.positions: list[Position] = []
+        self.velocities: list[Velocity] = []
+        self.slots: dict[int, int] = {}  # entity -> slot
+        # Bumped whenever bodies are bound or released, i.e. slots may have
+        # moved
+        self.version = 0
+
+        # esper hands out the same cached list until a component is added
+        # or removed anywhere, so an unchanged list means unchanged bodies.
+        self._source: list | None = None
+        # Entities released and bound since the last take_changes()
+        self._released: list[int] = []
+        self._bound: list[int] = []
+
+        # Entities in sorted order and their slots, for slots_of(), as of
+        # version _lookup_version
+        self._lookup_version = -1
+        self._sorted_entities: npt.NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._sorted_slots: npt.NDArray[np.intp] = np.empty(0, dtype=np.intp)
+
+    def sync(self) -> None:
+        pairs = esper.get_components(Position, Velocity)
+        if pairs is self._source:
+            return
+        self._source = pairs
+        self.version += 1
+
+        asteroids = {ent for ent, _ in esper.get_component(ResourceSource)}
+        seen: set[int] = set()
+
+        for ent, (pos, vel) in pairs:
+            seen.add(ent)
+            slot = self.slots.get(ent)
+
+            if slot is not None and (
+                self.positions[slot] is not pos or self.velocities[slot] is not vel
+            ):
+                self._release(ent)
+                slot = None
+
+            if slot is None:
+                slot = self._bind(ent, pos, vel)
+
+            self.limit_class[slot] = LIMIT_ASTEROID if ent in asteroids else LIMIT_MAP
+
+        for ent in [ent for ent in self.slots if ent not in seen]:
+            self._release(ent)
+
+    def take_changes(self) -> tuple[list[int], list[int]]:
+        """Entities released and entities bound since the last call.
+
+        An entity can be in both, and may have been released again since it
+        was bound; check ``slots`` for its current state.
+        """
+        released, self._released = self._released, []
+        bound, self._bound = self._bound, []
+        return released, bound
+
+    def save_previous(self) -> None:
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def interpolate(
+        self, alpha: float
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Positions of every slot blended ``alpha`` of the way from the
+        previous step."""
+        n = self.count
+        prev_x = self.prev_x[:n]
+        prev_y = self.prev_y[:n]
+        return (
+            prev_x + (self.x[:n] - prev_x) * alpha,
+            prev_y + (self.y[:n] - prev_y) * alpha,
+        )
+
+    def take_draw_updates(
+        self, alpha: float, slots: npt.NDArray[np.intp] | None = None
+    ) -> tuple[list[int], list[float], list[float]]:
+        """Slots whose drawn position changed, and where to draw them.
+
+        Positions are interpolated as by ``interpolate``. Only slots (of
+        ``slots``, or all) that differ from what was last drawn are returned,
+        and they are recorded as drawn.
+        """
+        xs, ys = self.interpolate(alpha)
+        if slots is not None:
+            xs = xs[slots]
+            ys = ys[slots]
+        else:
+            slots = np.arange(self.count)
+
+        moved = np.flatnonzero(
+            (xs != self.drawn_x[slots]) | (ys != self.drawn_y[slots])
+        )
+        changed = slots[moved]
+        xs = xs[moved]
+        ys = ys[moved]
+        self.drawn_x[changed] = xs
+        self.drawn_y[changed] = ys
+
+        return changed.tolist(), xs.tolist(), ys.tolist()
+
+    def slots_of(self, entities: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+        """Slot of each of ``entities``, or -1 for those without a body."""
+        if self._lookup_version != self.version:
+            ids = np.array(self.entities, dtype=np.intp)
+            order = np.argsort(ids)
+            self._sorted_entities = ids[order]
+            self._sorted_slots = order
+            self._lookup_version = self.version
+
+        ids = self._sorted_entities
+        if len(ids) == 0:
+            return np.full(len(entities), -1, dtype=np.intp)
+        found = np.minimum(np.searchsorted(ids, entities), len(ids) - 1)
+        return np.where(ids[found] == entities, self._sorted_slots[found], -1)
+
+    def clear(self) -> None:
+        for ent in list(self.slots):
+            self._release(ent)
+        self._source = None
+        self.version += 1
+
+    def _bind(self, ent: int, pos: Position, vel: Velocity) -> int:
+        slot = self.count
+        if slot == len(self.x):
+            self._grow()
+
+        self.x[slot] = pos.x
+        self.y[slot] = pos.y
+        self.dx[slot] = vel.dx
+        self.dy[slot] = vel.dy
+        self.prev_x[slot] = self.x[slot]
+        self.prev_y[slot] = self.y[slot]
+        self.drawn_x[slot] = np.nan
+        self.drawn_y[slot] = np.nan
+
+        pos._store, pos._slot = self, slot
+        vel._store, vel._slot = self, slot
+
+        self.entities.append(ent)
+        self.positions.append(pos)
+        self.velocities.append(vel)
+        self.slots[ent] = slot
+        self._bound.append(ent)
+        self.count += 1
+        return slot
+
+    def _release(self, ent: int) -> None:
+        slot = self.slots.pop(ent)
+        self._released.append(ent)
+        pos = self.positions[slot]
+        vel = self.velocities[slot]
+
+        # Hand the values back in case the component outlives the body
+        pos._x, pos._y = float(self.x[slot]), float(self.y[slot])
+        vel._dx, vel._dy = float(self.dx[slot]), float(self.dy[slot])
+        pos._store = vel._store = None
+        pos._slot = vel._slot = -1
+
+        last = self.count - 1
+        if slot != last:
+            for array in self._arrays():
+                array[slot] = array[last]
+
+            moved = self.entities[last]
+            self.entities[slot] = moved
+            self.positions[slot] = self.positions[last]
+            self.velocities[slot] = self.velocities[last]
+            self.positions[slot]._slot = slot
+            self.velocities[slot]._slot = slot
+            self.slots[moved] = slot
+
+        self.entities.pop()
+        self.positions.pop()
+        self.velocities.pop()
+        self.count = last
+
+    def _arrays(self) -> tuple[np.ndarray, ...]:
+        return (
+            self.x,
+            self.y,
+            self.dx,
+            self.dy,
+            self.prev_x,
+            self.prev_y,
+            self.drawn_x,
+            self.drawn_y,
+            self.limit_class,
+        )
+
+    def _grow(self) -> None:
+        capacity = len(self.x) * 2
+        (
+            self.x,
+            self.y,
+            self.dx,
+            self.dy,
+            self.prev_x,
+            self.prev_y,
+            self.drawn_x,
+            self.drawn_y,
+            self.limit_class,
+        ) = (np.resize(array, capacity) for array in self._arrays())
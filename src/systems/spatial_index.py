@@ -0,0 +1,137 @@
+import math
+from collections.abc import Iterable
+
+import esper
+
+from src.components.gameplay import ResourceSource
+from src.components.logistics import Collector, Drone, ResourceChunk, Storage
+from src.components.physics import Position
+from src.components.production import Factory
+from src.components.render import Renderable
+from src.game_data import MAP_LIMIT_X, MAP_LIMIT_Y
+from src.spatial.quadtree import Point, QuadTree, Rectangle
+from src.sprites import asteroid_texture
+
+MOVING_LOOSENESS = 1.25
+
+# Farthest a point inside an unscaled asteroid sprite can be from its center
+ASTEROID_PICK_RADIUS = math.hypot(asteroid_texture.width, asteroid_texture.height) / 2
+
+
+class SpatialIndexService:
+    """One spatial index per entity kind, shared by every processor.
+
+    ``update`` is called once per tick, before the simulation processors
+    run, so all of them query the positions MovementProcessor produced on
+    the previous tick. Entities created or destroyed during a tick show up
+    in (or drop out of) the layers on the next update. ``clear`` empties
+    every layer when the world is reset.
+    """
+
+    def __init__(self) -> None:
+        boundary = Rectangle(0, 0, MAP_LIMIT_X * 1.5, MAP_LIMIT_Y * 1.5)
+
+        # Moving layers use loose nodes so drifting bodies rarely relocate
+        self.asteroids = QuadTree(boundary, capacity=8, looseness=MOVING_LOOSENESS)
+        self.chunks = QuadTree(boundary, capacity=8, looseness=MOVING_LOOSENESS)
+        self.drones = QuadTree(boundary, capacity=8, looseness=MOVING_LOOSENESS)
+
+        # Structures by logistics role, so a drone looking for one kind only
+        # walks the structures of that kind
+        self.collectors = QuadTree(boundary, capacity=8)
+        self.factories = QuadTree(boundary, capacity=8)
+        self.storages = QuadTree(boundary, capacity=8)
+
+    def update(self) -> None:
+        self._sync_layer(
+            self.asteroids,
+            (
+                (ent, pos)
+                for ent, (res, pos) in esper.get_components(ResourceSource, Position)
+                # Depleted asteroids are already scheduled for deletion
+                if res.amount > 0
+            ),
+        )
+        self._sync_layer(
+            self.chunks,
+            (
+                (ent, pos)
+                for ent, (chunk, pos) in esper.get_components(ResourceChunk, Position)
+            ),
+        )
+        self._sync_layer(
+            self.drones,
+            ((ent, pos) for ent, (drone, pos) in esper.get_components(Drone, Position)),
+        )
+        self._sync_layer(
+            self.collectors,
+            (
+                (ent, pos)
+                for ent, (collector, pos) in esper.get_components(Collector, Position)
+            ),
+        )
+        self._sync_layer(
+            self.factories,
+            (
+                (ent, pos)
+                for ent, (factory, pos) in esper.get_components(Factory, Position)
+            ),
+        )
+        self._sync_layer(
+            self.storages,
+            (
+                (ent, pos)
+                for ent, (storage, pos) in esper.get_components(Storage, Position)
+            ),
+        )
+
+    def pick_asteroid(self, x: float, y: float) -> int | None:
+        """Asteroid with resources left whose sprite covers world point (x, y).
+
+        Candidates come from a radius query on the asteroid layer; each is
+        then checked against its own scaled bounding circle, and only those
+        inside it get the exact polygon hit test.
+        """
+        for ent in self.asteroids.query_radius(x, y, ASTEROID_PICK_RADIUS):
+            if not esper.entity_exists(ent):
+                continue
+
+            res_source = esper.try_component(ent, ResourceSource)
+            renderable = esper.try_component(ent, Renderable)
+            if res_source is None or renderable is None or res_source.amount <= 0:
+                continue
+
+            sprite = renderable.sprite
+            radius = ASTEROID_PICK_RADIUS * max(sprite.scale_x, sprite.scale_y)
+            if math.hypot(x - sprite.center_x, y - sprite.center_y) > radius:
+                continue
+
+            if sprite.collides_with_point((x, y)):
+                return ent
+
+        return None
+
+    def clear(self) -> None:
+        self.asteroids.clear()
+        self.chunks.clear()
+        self.drones.clear()
+        self.collectors.clear()
+        self.factories.clear()
+        self.storages.clear()
+
+    @staticmethod
+    def _sync_layer(layer: QuadTree, entries: Iterable[tuple[int, Position]]) -> None:
+        seen: set[int] = set()
+
+        for ent, pos in entries:
+            seen.add(ent)
+            point = layer.get(ent)
+
+            if point is None:
+                layer.insert(Point(pos.x, pos.y, ent))
+            elif point.x != pos.x or point.y != pos.y:
+                layer.update(ent, pos.x, pos.y)
+
+        for ent in layer.ids():
+            if ent not in seen:
+                layer.remove(ent)
@@ -10,6 +10,7 @@ from src.processors import (
     KeyboardProcessor,
     MouseProcessor,
 )
+from src.processors.builder import ACTUAL_TILE_SIZE
 from src.processors.player_control import PlayerControlProcessor
 from src.processors.mining import MiningProcessor
 from src.processors.combat import CombatProcessor
@@ -21,58 +22,81 @@ from src.entities.asteroids import create_asteroid
 from src.entities.player import create_player
 from src.components.world import WorldMap
 from src.views.pause import PauseView
+from src.views.settings import SETTINGS
+from src.rendering import BeamBatch
+from src.rendering.beams import DrawPositionFn
 from src.systems.audio import AudioSystem
+from src.systems.spatial_index import SpatialIndexService
+from src.game_data import SIMULATION_TICK_RATE, MAX_CATCH_UP_STEPS
 
 
 class GameView(arcade.View):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        tick_rate: float = SIMULATION_TICK_RATE,
+        max_catch_up_steps: int = MAX_CATCH_UP_STEPS,
+    ) -> None:
         super().__init__()
 
+        self.tick_dt = 1.0 / tick_rate
+        self.max_catch_up_steps = max_catch_up_steps
+        self.tick_accumulator = 0.0
+
         self.camera = arcade.Camera2D()
         self.default_ui_camera = arcade.Camera2D()
 
         self.keyboard_processor = KeyboardProcessor()
         self.mouse_processor = MouseProcessor()
+        self.spatial_index = SpatialIndexService()
 
         self.player_control = PlayerControlProcessor(self.keyboard_processor)
         self.movement_processor = MovementProcessor()
 
         self.camera_processor = CameraProcessor(
-            self.camera, self.keyboard_processor, self.mouse_processor
+            self.camera, self.keyboard_processor, self.mouse_processor, ACTUAL_TILE_SIZE
         )
 
         self.render_processor = RenderProcessor(
-            self.window, self.camera, self.default_ui_camera
+            self.window,
+            self.camera,
+            self.default_ui_camera,
+            self.movement_processor.store,
+            self.mouse_processor.frame,
         )
 
         self.mining_processor = MiningProcessor(
             self.camera,
             self.mouse_processor,
-            self.render_processor.sprite_lists["chunks"],
+            self.spatial_index,
         )
         self.combat_processor = CombatProcessor(
             self.mining_processor,
-            self.render_processor.sprite_lists["projectiles"],
-        )
-        self.logistics_processor = LogisticsProcessor(
-            self.render_processor.sprite_lists["drones"]
+            self.render_processor.sprite_pools["projectiles"],
+            self.spatial_index,
         )
+        self.logistics_processor = LogisticsProcessor(self.spatial_index)
+        self.render_processor.beam_sources += [
+            self.mining_processor.add_beams,
+            self.combat_processor.add_tracers,
+            self._add_tethers,
+        ]
         self.production_processor = ProductionProcessor()
 
         self.builder_processor = BuilderProcessor(
-            self.render_processor.sprite_lists["floor"],
-            self.render_processor.sprite_lists["objects"],
-            self.render_processor.sprite_lists["drones"],
+            self.render_processor.floor_layer,
+            self.render_processor.object_layer,
             self.camera,
             self.mouse_processor,
             self.keyboard_processor,
         )
+        self.render_processor.floor_renderer = self.builder_processor.floor
 
         self.ui_processor = UIProcessor(
             self.window,
             self.mouse_processor,
             self.keyboard_processor,
             self.builder_processor,
+            self.spatial_index,
         )
 
         self.audio_system = AudioSystem()
@@ -101,28 +125,58 @@ class GameView(arcade.View):
             )
 
         self.asteroid_spawn_timer = 0.0
+        self.camera_processor.update_input_frame()
 
     def on_update(self, delta_time: float) -> None:
-        self._update_asteroid_spawning(delta_time)
-        self.keyboard_processor.process(delta_time)
+        # Every tick of this frame sees the cursor over what was drawn last
+        self.camera_processor.update_input_frame()
 
-        self.player_control.process(delta_time)
+        self.tick_accumulator += delta_time
 
-        self.mining_processor.process(delta_time)
-        self.combat_processor.process(delta_time)
-        self.logistics_processor.process(delta_time)
-        self.production_processor.process(delta_time)
-        self.builder_processor.process(delta_time)
+        steps = 0
+        while self.tick_accumulator >= self.tick_dt:
+            if steps == self.max_catch_up_steps:
+                # Too far behind to catch up; slow the game down instead of
+                # spending every following frame simulating.
+                self.tick_accumulator = 0.0
+                break
 
-        self.movement_processor.process(delta_time)
+            self._simulate(self.tick_dt)
+            self.tick_accumulator -= self.tick_dt
+            steps += 1
 
-        self.camera_processor.process(delta_time)
+        self.render_processor.alpha = self.tick_accumulator / self.tick_dt
         self.render_processor.process(delta_time)
+        self.camera_processor.process(delta_time)
         self.ui_processor.process(delta_time)
 
         self.mouse_processor.process(delta_time)
+
+    def _simulate(self, dt: float) -> None:
+        self.render_processor.save_previous()
+
+        self._update_asteroid_spawning(dt)
+        # Positions are final here: MovementProcessor and esper.process() ran
+        # at the end of the previous tick.
+        self.spatial_index.update()
+        self.keyboard_processor.process(dt)
+
+        self.player_control.process(dt)
+
+        self.mining_processor.process(dt)
+        self.combat_processor.process(dt)
+        self.logistics_processor.process(dt)
+        self.production_processor.process(dt)
+        self.builder_processor.process(dt)
+
+        self.movement_processor.process(dt)
         esper.process()
 
+    @staticmethod
+    def _add_tethers(beams: BeamBatch, draw_position: DrawPositionFn) -> None:
+        if SETTINGS["drone_tethers"]:
+            LogisticsProcessor.add_tethers(beams, draw_position)
+
     def on_draw(self) -> None:
         self.clear()
 
@@ -135,6 +189,7 @@ class GameView(arcade.View):
     def on_resize(self, width: int, height: int) -> None:
         super().on_resize(width, height)
         self.render_processor.on_resize(width, height)
+        self.camera_processor.update_input_frame()
 
     def on_mouse_press(self, x: int, y: int, button: int, modifiers: int):
         self.mouse_processor.on_mouse_press(x, y, button, modifiers)
@@ -51,7 +51,11 @@ class PauseView(arcade.View):
         save_game(self.game_view.builder_processor)
 
     def on_click_load(self, event):
-        load_game(self.game_view.builder_processor, self.game_view.render_processor)
+        load_game(
+            self.game_view.builder_processor,
+            self.game_view.render_processor,
+            self.game_view.spatial_index,
+        )
         self.window.show_view(self.game_view)
 
     def on_click_settings(self, event):
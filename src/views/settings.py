@@ -5,6 +5,7 @@ from src.systems.audio import AudioSystem
 SETTINGS = {
     "master_volume": 50,
     "music_volume": 50,
+    "drone_tethers": True,
 }
 
 
@@ -41,6 +42,13 @@ class SettingsView(arcade.View):
         self.music_slider.on_change = self.on_music_volume_change  # type: ignore
         self.v_box.add(self.music_slider)
 
+        # Drone Tethers
+        self.tethers_button = arcade.gui.UIFlatButton(
+            text=self._tethers_text(), width=300
+        )
+        self.tethers_button.on_click = self.on_click_tethers  # type: ignore
+        self.v_box.add(self.tethers_button.with_padding(top=20))
+
         # Back Button
         back_button = arcade.gui.UIFlatButton(text="Back", width=200)
         self.v_box.add(back_button.with_padding(top=40))
@@ -62,6 +70,14 @@ class SettingsView(arcade.View):
         SETTINGS["music_volume"] = self.music_slider.value
         AudioSystem().set_volume(SETTINGS["master_volume"], SETTINGS["music_volume"])
 
+    def on_click_tethers(self, event):
+        SETTINGS["drone_tethers"] = not SETTINGS["drone_tethers"]
+        self.tethers_button.text = self._tethers_text()
+
+    @staticmethod
+    def _tethers_text():
+        return f"Drone Tethers: {'On' if SETTINGS['drone_tethers'] else 'Off'}"
+
     def on_click_back(self, event):
         self.window.show_view(self.previous_view)
 